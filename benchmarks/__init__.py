@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Benchmarks of the measurement hot path, executed against simulated sensors.
+Run them with ``python -m benchmarks --output results.json``.
+"""
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+from benchmarks.hot_path import main
+
+sys.exit(main())
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import platform
+import time
+from struct import pack
+
+from sensirion_i2c_driver import I2cConnection
+
+from sensirion_i2c_sdp.sdp.crc import calculate_crc
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.extended_commands import SdpI2cCmdReadMeasurementFast
+from sensirion_i2c_sdp.sdp.group import SdpI2cDeviceGroup
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure, SdpTemperature
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+from sensirion_i2c_sdp.version import version
+
+SENSOR_COUNTS = (1, 10, 100)
+
+# Valid SDP addresses, the sensors are distributed over as many simulated
+# buses as needed (like several SensorBridge ports).
+ADDRESSES = (0x21, 0x22, 0x23, 0x25, 0x26)
+
+
+def create_devices(count, latency=0.0):
+    """
+    Create the given number of devices with simulated sensors.
+    """
+    devices = []
+    while len(devices) < count:
+        addresses = ADDRESSES[:count - len(devices)]
+        transceiver = SdpSimulatedI2cTransceiver(dict((a, SdpSimulatedSensor()) for a in addresses), latency)
+        connection = I2cConnection(transceiver)
+        # Without pacing the reads, so that the transfers are measured
+        # instead of waiting for new results of the sensor
+        devices.extend(SdpI2cDevice(connection, a, pace_reads=False) for a in addresses)
+    return devices
+
+
+def measure(name, function, calls_per_iteration, iterations, **info):
+    """
+    Execute a function repeatedly and return the timing as a dict.
+    """
+    function()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    total = time.perf_counter() - start
+    calls = calls_per_iteration * iterations
+    result = dict(name=name, calls=calls, total_s=total, per_call_us=1e6 * total / calls,
+                  throughput_hz=calls / total)
+    result.update(info)
+    return result
+
+
+def bench_interpret_response(iterations):
+    data = bytearray()
+    for i, byte in enumerate(pack(">hhh", -90, 5000, 60)):
+        data.append(byte)
+        if i % 2 == 1:
+            data.append(calculate_crc(data[-2:]))
+    data = bytes(data)
+    command = SdpI2cCmdReadMeasurementFast()
+    return [measure("interpret_response", lambda: command.interpret_response(data), 1, iterations)]
+
+
+def bench_response_objects(iterations):
+    return [measure("response_objects", lambda: (SdpDifferentialPressure(-90, 60), SdpTemperature(5000)), 1,
+                    iterations)]
+
+
+def bench_command_construction(iterations):
+    return [measure("command_construction", SdpI2cCmdReadMeasurementFast, 1, iterations)]
+
+
+def bench_read_measurement(iterations, latency):
+    results = []
+    for count in SENSOR_COUNTS:
+        devices = create_devices(count, latency)
+        for device in devices:
+            device.start_continuous_measurement_with_diff_pressure_t_comp()
+        reads = [device.read_measurement for device in devices]
+
+        def read_all():
+            for read in reads:
+                read()
+        results.append(measure("read_measurement", read_all, count, max(1, iterations // count),
+                               sensors=count, mode="continuous", latency_s=latency))
+        for device in devices:
+            device.stop_continuous_measurement()
+
+        # Triggered measurements take 45ms, thus the sensors are interleaved
+        group = SdpI2cDeviceGroup(create_devices(count, latency))
+        trigger_and_read_all = group.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging
+        results.append(measure("read_measurement", trigger_and_read_all, count, max(1, iterations // 1000),
+                               sensors=count, mode="triggered", latency_s=latency))
+    return results
+
+
+def run(iterations=10000, latency=0.0):
+    """
+    Run all benchmarks.
+
+    :param int iterations: Number of iterations per benchmark.
+    :param float latency: Simulated latency in seconds of every transfer.
+    :return: The results, ready to be serialized as JSON.
+    :rtype: dict
+    """
+    results = []
+    results += bench_interpret_response(iterations)
+    results += bench_response_objects(iterations)
+    results += bench_command_construction(iterations)
+    results += bench_read_measurement(iterations, latency)
+    return dict(
+        package_version=version,
+        python_version=platform.python_version(),
+        python_implementation=platform.python_implementation(),
+        timestamp=time.time(),
+        results=results,
+    )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SDP driver measurement hot path.")
+    parser.add_argument("--output", help="JSON file to write the results to (default: stdout)")
+    parser.add_argument("--iterations", type=int, default=10000, help="iterations per benchmark")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated latency per transfer in seconds")
+    args = parser.parse_args(args)
+    results = run(args.iterations, args.latency)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    return 0
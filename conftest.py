@@ -7,6 +7,7 @@ from sensirion_shdlc_sensorbridge import SensorBridgePort, \
     SensorBridgeShdlcDevice, SensorBridgeI2cProxy
 from sensirion_i2c_driver import I2cConnection
 from sensirion_i2c_sdp import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver
 import pytest
 
 
@@ -14,8 +15,8 @@ def pytest_addoption(parser):
     """
     Register command line options
     """
-    parser.addoption("--serial-port", action="store", type="string")
-    parser.addoption("--serial-bitrate", action="store", type="int",
+    parser.addoption("--serial-port", action="store", type=str)
+    parser.addoption("--serial-bitrate", action="store", type=int,
                      default=460800)
 
 
@@ -75,3 +76,15 @@ def sdp(bridge):
 
     # make sure the channel is powered off after executing tests
     bridge.switch_supply_off(SensorBridgePort.ONE)
+
+
+@pytest.fixture
+def sdp_simulator():
+    # Simulated I2C bus with one SDP sensor at the default address 0x25
+    yield SdpSimulatedI2cTransceiver()
+
+
+@pytest.fixture
+def simulated_sdp(sdp_simulator):
+    # SDP device without hardware, see sdp_simulator
+    yield SdpI2cDevice(I2cConnection(sdp_simulator))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import functools
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from sensirion_i2c_sdp.sdp.bus import SdpI2cBus
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+
+# Executor shared by all devices on a connection, and the number of devices
+# using it. Devices sharing a plain connection get a single-threaded
+# executor, so that they never transceive concurrently, while different
+# connections run in parallel. An SdpI2cBus serializes the transfers itself,
+# thus its devices may share an executor with several threads.
+_connection_executors = weakref.WeakKeyDictionary()
+
+
+def _acquire_connection_executor(connection):
+    executor, users = _connection_executors.get(connection, (None, 0))
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=None if isinstance(connection, SdpI2cBus) else 1)
+    _connection_executors[connection] = (executor, users + 1)
+    return executor
+
+
+def _release_connection_executor(connection):
+    executor, users = _connection_executors.pop(connection)
+    if users > 1:
+        _connection_executors[connection] = (executor, users - 1)
+    else:
+        executor.shutdown(wait=False)
+
+
+class AsyncSdpI2cDevice(object):
+    """
+    SDP I²C device class with an :py:mod:`asyncio` API.
+
+    All methods delegate to the wrapped
+    :py:class:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice` (see
+    :py:attr:`device`), which is called in an executor. Before, the post
+    processing time of the previous command (e.g. 45ms after triggering a
+    measurement, see
+    :py:attr:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.ready_at`) is awaited
+    with :py:func:`asyncio.sleep`. Thus a single event loop can serve many
+    sensors without being blocked.
+
+    The ``trigger_and_read_*()`` methods wait for the measurement within a
+    single I²C transfer, which occupies the executor of the connection. To
+    measure several sensors on the same bus concurrently, pass an
+    :py:class:`~sensirion_i2c_sdp.sdp.bus.SdpI2cBus` as connection.
+
+    The device should be closed to release its executor, e.g. by using it as
+    asynchronous context manager:
+
+    .. sourcecode:: python
+
+        async with AsyncSdpI2cDevice(I2cConnection(i2c_transceiver), slave_address=0x25) as sdp:
+            dp, temperature = await sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    """
+
+    def __init__(self, connection, slave_address=0x25, executor=None):
+        """
+        Constructs a new asynchronous SDP I²C device.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The I²C connection to use for communication.
+        :param byte slave_address:
+            The I²C slave address, defaults to 0x25.
+        :param ~concurrent.futures.Executor executor:
+            The executor to run the I²C transfers in. It is not shut down by
+            :py:meth:`close`. Defaults to an executor shared by all devices
+            on the same connection.
+        """
+        super(AsyncSdpI2cDevice, self).__init__()
+        self._device = SdpI2cDevice(connection, slave_address)
+        self._owns_executor = executor is None
+        self._executor = _acquire_connection_executor(connection) if executor is None else executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def device(self):
+        """
+        Get the underlying synchronous device.
+
+        :rtype: ~sensirion_i2c_sdp.sdp.device.SdpI2cDevice
+        """
+        return self._device
+
+    @property
+    def slave_address(self):
+        """
+        Get the I²C slave address.
+
+        :rtype: byte
+        """
+        return self._device.slave_address
+
+    def close(self):
+        """
+        Release the executor. The executor shared by the devices of a
+        connection is shut down when the last of them is closed.
+        """
+        if self._owns_executor:
+            self._owns_executor = False
+            _release_connection_executor(self._device.connection)
+        self._executor = None
+
+    async def wait_until_ready(self):
+        """
+        Wait until the sensor has finished the post processing of the last
+        command.
+        """
+        await self._wait_until(self._device.ready_at)
+
+    async def execute(self, command):
+        """
+        Execute an I²C command on this device, after awaiting the post
+        processing time of the previous command.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to be executed.
+        :return:
+            The interpreted response of the executed command.
+        """
+        return await self._call(self._device.execute, command)
+
+    async def read_product_identifier(self, refresh=False):
+        """
+        Read the product identifier and serial number of the sensor. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_product_identifier`.
+
+        :param bool refresh:
+            If True, the identifier is read from the sensor even if it is
+            cached.
+        :return: The product number and serial number.
+        :rtype: tuple
+        """
+        return await self._call(self._device.read_product_identifier, refresh)
+
+    async def start_continuous_measurement_with_mass_flow_t_comp_and_averaging(self):
+        """
+        Start continuous measurements with mass flow temperature compensation
+        and the average till read feature. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.start_continuous_measurement_with_mass_flow_t_comp_and_averaging`.
+        """
+        return await self._call(self._device.start_continuous_measurement_with_mass_flow_t_comp_and_averaging)
+
+    async def start_continuous_measurement_with_mass_flow_t_comp(self):
+        """
+        Start continuous measurements with mass flow temperature compensation.
+        See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.start_continuous_measurement_with_mass_flow_t_comp`.
+        """
+        return await self._call(self._device.start_continuous_measurement_with_mass_flow_t_comp)
+
+    async def start_continuous_measurement_with_diff_pressure_t_comp_and_averaging(self):
+        """
+        Start continuous measurements with differential pressure temperature
+        compensation and the average till read feature. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.start_continuous_measurement_with_diff_pressure_t_comp_and_averaging`.
+        """
+        return await self._call(self._device.start_continuous_measurement_with_diff_pressure_t_comp_and_averaging)
+
+    async def start_continuous_measurement_with_diff_pressure_t_comp(self):
+        """
+        Start continuous measurements with differential pressure temperature
+        compensation. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.start_continuous_measurement_with_diff_pressure_t_comp`.
+        """
+        return await self._call(self._device.start_continuous_measurement_with_diff_pressure_t_comp)
+
+    async def stop_continuous_measurement(self):
+        """
+        Stop the continuous measurement. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.stop_continuous_measurement`.
+        """
+        return await self._call(self._device.stop_continuous_measurement)
+
+    async def trigger_measurement_with_mass_flow_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with mass flow temperature
+        compensation. The next command awaits the end of the measurement.
+        """
+        return await self._call(self._device.trigger_measurement_with_mass_flow_t_comp_and_averaging)
+
+    async def trigger_measurement_with_diff_pressure_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with differential pressure
+        temperature compensation. The next command awaits the end of the
+        measurement.
+        """
+        return await self._call(self._device.trigger_measurement_with_diff_pressure_t_comp_and_averaging)
+
+    async def read_measurement(self):
+        """
+        Read Measurement from sensor. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_measurement`.
+
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature)
+              Temperature response object.
+        :rtype: tuple
+        """
+        device = self._device
+        await self._wait_until(device.result_available_at if device.pace_reads else device.ready_at)
+        return await self._run(device.read_measurement)
+
+    async def trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with mass flow temperature
+        compensation and read its result within a single I²C transfer. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging`.
+
+        :return: The differential pressure and temperature response objects.
+        :rtype: tuple
+        """
+        return await self._call(self._device.trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging)
+
+    async def trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with differential pressure
+        temperature compensation and read its result within a single I²C
+        transfer. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging`.
+
+        :return: The differential pressure and temperature response objects.
+        :rtype: tuple
+        """
+        return await self._call(self._device.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging)
+
+    async def enter_sleep_mode(self):
+        """
+        Put the sensor into sleep mode. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.enter_sleep_mode`.
+        """
+        await self._call(self._device.enter_sleep_mode)
+
+    async def exit_sleep_mode(self):
+        """
+        Exit sleep mode. See
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.exit_sleep_mode`.
+        """
+        await self._call(self._device.exit_sleep_mode)
+
+    @staticmethod
+    async def _wait_until(deadline):
+        delay = deadline - time.monotonic()
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+
+    async def _call(self, func, *args):
+        # Await the post processing of the previous command here, so that the
+        # device does not block the executor while waiting for it.
+        await self.wait_until_ready()
+        return await self._run(func, *args)
+
+    async def _run(self, func, *args):
+        if self._executor is None:
+            raise RuntimeError("The device is closed.")
+        # Within a coroutine, this is the running loop (get_running_loop()
+        # requires Python 3.7).
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Arbitration of an I²C bus shared by several devices which are driven from
+different threads.
+
+.. sourcecode:: python
+
+    bus = SdpI2cBus(I2cConnection(i2c_transceiver))
+    sdp_1 = SdpI2cDevice(bus, slave_address=0x21)
+    sdp_2 = SdpI2cDevice(bus, slave_address=0x22)
+    # sdp_1 and sdp_2 may now be used from different threads
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import time
+
+from sensirion_i2c_driver import I2cCommand
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdBase
+
+
+class _TicketLock(object):
+    """
+    Lock which is acquired in the order of the acquire calls (FIFO), so that
+    no thread can starve the others.
+    """
+
+    def __init__(self):
+        super(_TicketLock, self).__init__()
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._now_serving = 0
+
+    def acquire(self):
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            while ticket != self._now_serving:
+                self._condition.wait()
+
+    def release(self):
+        with self._condition:
+            self._now_serving += 1
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class SdpI2cBus(object):
+    """
+    Wrapper around a (single channel)
+    :py:class:`~sensirion_i2c_driver.connection.I2cConnection` which allows
+    devices on the same bus to be driven from several threads. It can be
+    passed to :py:class:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice` in
+    place of the connection.
+
+    The I²C transfers are serialized in the order they are requested. The
+    bus is only locked while data is transferred: The read delay of a
+    command (e.g. 45ms of
+    :py:class:`~sensirion_i2c_sdp.sdp.extended_commands.SdpI2cCmdTriggerAndReadMeasurement`)
+    is waited between separate write and read transfers, and post processing
+    times are waited after releasing the bus. Thus other devices can
+    communicate while a device is busy.
+
+    Only SDP commands (:py:class:`~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdBase`)
+    are split into separate transfers, since the SDP sensors keep the
+    result until it is read. Other commands are executed in a single
+    transfer, i.e. the bus is locked during their read delay.
+    """
+
+    def __init__(self, connection):
+        """
+        Creates a shared bus.
+
+        :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+            The connection to the bus.
+        """
+        super(SdpI2cBus, self).__init__()
+        self._connection = connection
+        self._lock = _TicketLock()
+
+    @property
+    def connection(self):
+        """
+        Get the underlying connection.
+
+        :rtype: ~sensirion_i2c_driver.connection.I2cConnection
+        """
+        return self._connection
+
+    @property
+    def is_multi_channel(self):
+        """
+        See :py:attr:`~sensirion_i2c_driver.connection.I2cConnection.is_multi_channel`.
+
+        :rtype: bool
+        """
+        return self._connection.is_multi_channel
+
+    def execute(self, slave_address, command, wait_post_process=True):
+        """
+        Execute a command like
+        :py:meth:`~sensirion_i2c_driver.connection.I2cConnection.execute`,
+        but with exclusive access to the bus during the transfers.
+
+        :param byte slave_address:
+            The slave address of the device to communicate with.
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to execute.
+        :param bool wait_post_process:
+            If ``True`` and the passed command needs some time for post
+            processing, this method waits until post processing is done
+            (without blocking the bus).
+        :return: The interpreted data of the command.
+        """
+        if (command.read_delay > 0.0) and (command.tx_data is not None) and (command.rx_length is not None) \
+                and isinstance(command, SdpI2cCmdBase) and not self._connection.is_multi_channel:
+            write = I2cCommand(command.tx_data, None, 0.0, command.timeout)
+            read = I2cCommand(None, command.rx_length, 0.0, command.timeout)
+            with self._lock:
+                self._connection.execute(slave_address, write, False)
+            time.sleep(command.read_delay)
+            with self._lock:
+                data = self._connection.execute(slave_address, read, False)
+            # Like the connection, only interpret received data
+            result = command.interpret_response(data) if data else None
+        else:
+            with self._lock:
+                result = self._connection.execute(slave_address, command, False)
+        if wait_post_process and command.post_processing_time > 0.0:
+            time.sleep(command.post_processing_time)
+        return result
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Table driven implementation of the CRC-8 used by SDP sensors (polynomial
+0x31, init value 0xFF, no final XOR) to protect every transferred 16-bit
+word.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from sensirion_i2c_driver.errors import I2cChecksumError
+
+
+def _build_table():
+    table = []
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x31) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return tuple(table)
+
+
+#: CRC-8 lookup table (polynomial 0x31) for all byte values.
+CRC8_TABLE = _build_table()
+
+# CRC of every possible 16-bit word, indexed by the big endian word value
+_WORD_CRC_TABLE = bytearray(CRC8_TABLE[CRC8_TABLE[0xFF ^ (word >> 8)] ^ (word & 0xFF)]
+                            for word in range(0x10000))
+
+
+def calculate_crc(data):
+    """
+    Calculate the CRC of the given data. This function can be passed as
+    ``crc`` to :py:class:`~sensirion_i2c_driver.sensirion_command.SensirionI2cCommand`.
+
+    :param iterable data:
+        The data bytes (usually a 16-bit word).
+    :return: The calculated CRC.
+    :rtype: int
+    """
+    crc = 0xFF
+    for value in bytearray(data):
+        crc = CRC8_TABLE[crc ^ value]
+    return crc
+
+
+def strip_crc(data):
+    """
+    Validate the CRC after every 16-bit word of the received data and return
+    the data with all CRCs removed.
+
+    :param bytes data:
+        Received raw bytes from the read operation.
+    :return:
+        The received bytes without CRCs, or None if there is no data.
+    :rtype:
+        bytes or None
+    :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+        If a received CRC was wrong.
+    """
+    data = bytearray(data)  # Python 2 compatibility
+    for i in range(2, len(data), 3):
+        expected_crc = _WORD_CRC_TABLE[(data[i - 2] << 8) | data[i - 1]]
+        if data[i] != expected_crc:
+            raise I2cChecksumError(data[i], expected_crc, data)
+    del data[2::3]
+    return bytes(data) if len(data) else None
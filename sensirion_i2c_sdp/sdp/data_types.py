@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+from enum import Enum
+
+
+class SdpMeasurementMode(Enum):
+    """
+    Operating mode of an SDP sensor, as derived from the last command sent
+    to it.
+    """
+
+    #: Idle mode, i.e. no measurement is running.
+    IDLE = 0
+
+    #: A continuous measurement has been started.
+    CONTINUOUS = 1
+
+    #: A single shot measurement has been triggered.
+    TRIGGERED = 2
+
+    #: The sensor has been put into sleep mode.
+    SLEEP = 3
+
+
+class SdpProductFamily(Enum):
+    """
+    Product family of an SDP sensor.
+    """
+
+    #: SDP3x, the small digital differential pressure sensors (SDP31, SDP32,
+    #: SDP33).
+    SDP3X = 0
+
+    #: SDP8xx, the differential pressure sensors with manifold or tube
+    #: connection (SDP800, SDP801, SDP810, SDP811).
+    SDP8XX = 1
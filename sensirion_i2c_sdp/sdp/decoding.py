@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Vectorized decoding of raw measurement frames as received by
+:py:class:`~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdReadMeasurement`.
+
+This module requires NumPy, which can be installed with
+``pip install sensirion-i2c-sdp[numpy]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from sensirion_i2c_sdp.sdp.crc import CRC8_TABLE
+
+#: Number of bytes of a raw measurement frame (3 words with CRC each).
+MEASUREMENT_FRAME_SIZE = 9
+
+
+#: Decoded measurement frames. All fields are NumPy arrays with one element
+#: per frame. The converted values of frames with a wrong CRC are NaN.
+SdpMeasurementFrames = namedtuple('SdpMeasurementFrames', [
+    'differential_pressure_ticks',
+    'temperature_ticks',
+    'scale_factor',
+    'pascal',
+    'degrees_celsius',
+    'valid',
+])
+
+
+def decode_measurement_frames(data):
+    """
+    Decode any number of concatenated raw measurement frames at once.
+
+    :param bytes-like data:
+        The raw frames (9 bytes each, including CRCs) as received from the
+        device, e.g. a ``bytes``, ``bytearray`` or ``memoryview``.
+    :return: The decoded frames together with a CRC validity mask.
+    :rtype: SdpMeasurementFrames
+    :raise ValueError:
+        If the length of the data is not a multiple of the frame size.
+    :raise ImportError:
+        If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required to decode measurement frames.")
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if raw.size % MEASUREMENT_FRAME_SIZE != 0:
+        raise ValueError("The data length ({}) is not a multiple of {}.".format(
+            raw.size, MEASUREMENT_FRAME_SIZE))
+    words = raw.reshape(-1, 3, 3)  # frame, word, [msb, lsb, crc]
+
+    # CRC-8 with init value 0xFF over the two bytes of every word
+    table = np.asarray(CRC8_TABLE, dtype=np.uint8)
+    expected_crc = table[table[words[:, :, 0] ^ 0xFF] ^ words[:, :, 1]]
+    valid = np.all(expected_crc == words[:, :, 2], axis=1)
+
+    ticks = np.ascontiguousarray(words[:, :, 0:2]).view('>i2').reshape(-1, 3).astype(np.int16)
+    differential_pressure_ticks = ticks[:, 0]
+    temperature_ticks = ticks[:, 1]
+    scale_factor = ticks[:, 2]
+
+    convertible = valid & (scale_factor != 0)
+    pascal = np.full(len(ticks), np.nan)
+    np.divide(differential_pressure_ticks, scale_factor, out=pascal, where=convertible)
+    degrees_celsius = np.where(valid, temperature_ticks / 200., np.nan)
+    return SdpMeasurementFrames(differential_pressure_ticks, temperature_ticks, scale_factor, pascal,
+                                degrees_celsius, valid)
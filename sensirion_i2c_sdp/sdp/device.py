@@ -3,15 +3,78 @@
 
 from __future__ import absolute_import, division, print_function
 
+import time
+import weakref
+
 from sensirion_i2c_driver import I2cDevice
+from sensirion_i2c_driver.errors import I2cNackError
 
-from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdPrepareProductIdentifier, SdpI2cCmdReadProductIdentifier, \
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdPrepareProductIdentifier, \
     SdpI2cCmdStartContinuousMeasurementWithMassFlowTCompAndAveraging, SdpI2cCmdStopContinuousMeasurement, \
     SdpI2cCmdReadMeasurement, SdpI2cCmdStartContinuousMeasurementWithMassFlowTComp, \
     SdpI2cCmdStartContinuousMeasurementWithDiffPressureTCompAndAveraging, \
     SdpI2cCmdStartContinuousMeasurementWithDiffPressureTComp, \
     SdpI2cCmdTriggerMeasurementWithMassFlowTCompAndAveraging, SdpI2cCmdTriggerMeasurementWithDiffPressureTComp, \
     SdpI2cCmdEnterSleepMode, SdpI2cCmdExitSleepMode
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+from sensirion_i2c_sdp.sdp.extended_commands import SdpI2cCmdReadMeasurementFast, \
+    SdpI2cCmdReadProductIdentifierFast, SdpI2cCmdReadDifferentialPressure, SdpI2cCmdTriggerAndReadMeasurement
+from sensirion_i2c_sdp.sdp.products import get_product
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure
+from sensirion_i2c_sdp.sdp.stream import SdpStream
+
+# Commands don't hold any state, thus a single instance of each command is
+# shared by all devices to avoid constructing them on every call.
+_CMD_PREPARE_PRODUCT_IDENTIFIER = SdpI2cCmdPrepareProductIdentifier()
+_CMD_READ_PRODUCT_IDENTIFIER = SdpI2cCmdReadProductIdentifierFast()
+_CMD_START_MASS_FLOW_AVERAGING = SdpI2cCmdStartContinuousMeasurementWithMassFlowTCompAndAveraging()
+_CMD_START_MASS_FLOW = SdpI2cCmdStartContinuousMeasurementWithMassFlowTComp()
+_CMD_START_DIFF_PRESSURE_AVERAGING = SdpI2cCmdStartContinuousMeasurementWithDiffPressureTCompAndAveraging()
+_CMD_START_DIFF_PRESSURE = SdpI2cCmdStartContinuousMeasurementWithDiffPressureTComp()
+_CMD_STOP = SdpI2cCmdStopContinuousMeasurement()
+_CMD_TRIGGER_MASS_FLOW_AVERAGING = SdpI2cCmdTriggerMeasurementWithMassFlowTCompAndAveraging()
+_CMD_TRIGGER_DIFF_PRESSURE = SdpI2cCmdTriggerMeasurementWithDiffPressureTComp()
+_CMD_TRIGGER_AND_READ_MASS_FLOW_AVERAGING = SdpI2cCmdTriggerAndReadMeasurement(_CMD_TRIGGER_MASS_FLOW_AVERAGING)
+_CMD_TRIGGER_AND_READ_DIFF_PRESSURE = SdpI2cCmdTriggerAndReadMeasurement(_CMD_TRIGGER_DIFF_PRESSURE)
+_CMD_READ_MEASUREMENT = SdpI2cCmdReadMeasurementFast()
+_CMD_READ_MEASUREMENT_NO_DELAY = SdpI2cCmdReadMeasurementFast(read_delay=0.0)
+_CMD_READ_DIFFERENTIAL_PRESSURE = SdpI2cCmdReadDifferentialPressure()
+_CMD_READ_DIFFERENTIAL_PRESSURE_NO_DELAY = SdpI2cCmdReadDifferentialPressure(read_delay=0.0)
+_CMD_ENTER_SLEEP = SdpI2cCmdEnterSleepMode()
+_CMD_EXIT_SLEEP = SdpI2cCmdExitSleepMode()
+
+#: Time after starting a continuous measurement until the first result is
+#: available.
+CONTINUOUS_FIRST_RESULT_DELAY = 0.008
+
+#: Time after starting a continuous measurement until the results are settled.
+#: Before, small accuracy deviations (few % of reading) can occur.
+CONTINUOUS_SETTLING_TIME = 0.020
+
+#: Interval at which the sensor updates the results of a continuous measurement.
+CONTINUOUS_UPDATE_INTERVAL = 0.0005
+
+# Commands reading a measurement result
+_READ_COMMANDS = (SdpI2cCmdReadMeasurement, SdpI2cCmdReadDifferentialPressure)
+
+# Product identifiers (product number, serial number) read from the sensors,
+# by connection and slave address.
+_product_identifiers = weakref.WeakKeyDictionary()
+
+# Measurement mode the sensor is in after successfully executing a command
+_MODE_AFTER_COMMAND = {
+    SdpI2cCmdStartContinuousMeasurementWithMassFlowTCompAndAveraging: SdpMeasurementMode.CONTINUOUS,
+    SdpI2cCmdStartContinuousMeasurementWithMassFlowTComp: SdpMeasurementMode.CONTINUOUS,
+    SdpI2cCmdStartContinuousMeasurementWithDiffPressureTCompAndAveraging: SdpMeasurementMode.CONTINUOUS,
+    SdpI2cCmdStartContinuousMeasurementWithDiffPressureTComp: SdpMeasurementMode.CONTINUOUS,
+    SdpI2cCmdTriggerMeasurementWithMassFlowTCompAndAveraging: SdpMeasurementMode.TRIGGERED,
+    SdpI2cCmdTriggerMeasurementWithDiffPressureTComp: SdpMeasurementMode.TRIGGERED,
+    # The result has been read within the same transfer
+    SdpI2cCmdTriggerAndReadMeasurement: SdpMeasurementMode.IDLE,
+    SdpI2cCmdStopContinuousMeasurement: SdpMeasurementMode.IDLE,
+    SdpI2cCmdEnterSleepMode: SdpMeasurementMode.SLEEP,
+    SdpI2cCmdExitSleepMode: SdpMeasurementMode.IDLE,
+}
 
 
 class SdpI2cDevice(I2cDevice):
@@ -24,9 +87,23 @@ class SdpI2cDevice(I2cDevice):
     SDP3x can support 0x21, 0x22 and 0x23.
 
     Please refer to the dedicated Datasheet for more details on the supported I2C address range.
+
+    Commands which need post processing time in the sensor (e.g. 45ms after
+    triggering a measurement) do not block. Instead, the time when the sensor
+    is ready again is recorded in :py:attr:`ready_at`, and only the next
+    command sent to this device waits for it if needed. Thus the caller can
+    do other work while the sensor is busy.
+
+    Optionally (see :py:attr:`pace_reads`) the same applies to reading
+    results of a continuous measurement: reads wait until the first result
+    is available 8ms after the start command, and subsequent reads are paced
+    to the 0.5ms update interval of the sensor, so the same result is never
+    read twice (see :py:attr:`result_available_at`). Results read during
+    the first 20ms are not yet settled, see :py:attr:`is_measurement_settled`.
     """
 
-    def __init__(self, connection, slave_address=0x25):
+    def __init__(self, connection, slave_address=0x25, temperature_refresh_interval=1.0, observer=None,
+                 pace_reads=False):
         """
         Constructs a new SDP I²C device.
 
@@ -34,18 +111,215 @@ class SdpI2cDevice(I2cDevice):
             The I²C connection to use for communication.
         :param byte slave_address:
             The I²C slave address, defaults to 0x25.
+        :param float/None temperature_refresh_interval:
+            Maximum age in seconds of the cached temperature returned by
+            :py:meth:`read_measurement_fast` before a full measurement is read
+            again. None means that the temperature is only read once after
+            every start of a measurement. Defaults to 1.0 s.
+        :param ~sensirion_i2c_sdp.sdp.instrumentation.SdpObserver observer:
+            Observer to be notified about every executed command, see
+            :py:attr:`observer`. Defaults to None.
+        :param bool pace_reads:
+            Whether reads of a continuous measurement wait for a new result,
+            see :py:attr:`pace_reads`. Defaults to False.
         """
         super().__init__(connection, slave_address)
+        self.temperature_refresh_interval = temperature_refresh_interval
+
+        #: If True, reads of a continuous measurement wait until
+        #: :py:attr:`result_available_at`, i.e. for the first result after
+        #: the start command and then for the next update of the sensor.
+        #: Otherwise reads are sent immediately (only the post processing
+        #: time of the start command is awaited), and may return the same
+        #: result several times.
+        self.pace_reads = pace_reads
+
+        #: Observer (:py:class:`~sensirion_i2c_sdp.sdp.instrumentation.SdpObserver`)
+        #: notified about every executed command, or None to disable the
+        #: instrumentation.
+        self.observer = observer
+        self._ready_at = 0.0
+        self._measurement_mode = None
+        self._measurement_started_at = None
+        self._next_result_at = 0.0
+        self._last_result_new = None
+        self._scale_factor = None
+        self._temperature = None
+        self._temperature_timestamp = None
+
+    @property
+    def measurement_mode(self):
+        """
+        Get the measurement mode the sensor is in, derived from the last
+        successfully executed command.
+
+        :return: The measurement mode, or None if no mode changing command has
+                 been executed yet.
+        :rtype: ~sensirion_i2c_sdp.sdp.data_types.SdpMeasurementMode/None
+        """
+        return self._measurement_mode
+
+    @property
+    def ready_at(self):
+        """
+        Get the time (see :py:func:`time.monotonic`) when the sensor has
+        finished the post processing of the last command and is ready to
+        receive the next command.
+
+        :rtype: float
+        """
+        return self._ready_at
+
+    @property
+    def measurement_started_at(self):
+        """
+        Get the time (see :py:func:`time.monotonic`) when the running
+        continuous measurement has been started.
+
+        :return: The start time, or None if no continuous measurement is running.
+        :rtype: float/None
+        """
+        return self._measurement_started_at
+
+    @property
+    def is_measurement_settled(self):
+        """
+        Check whether the results of the running continuous measurement are
+        settled, i.e. the start command has been sent at least 20ms ago.
+
+        :rtype: bool
+        """
+        return (self._measurement_started_at is not None) and \
+            (time.monotonic() - self._measurement_started_at >= CONTINUOUS_SETTLING_TIME)
 
-    def read_product_identifier(self):
+    @property
+    def is_last_result_new(self):
+        """
+        Check whether the last result read during a continuous measurement is
+        guaranteed to be a new result, i.e. its read has been sent at or after
+        :py:attr:`result_available_at`, thus the sensor has updated its result
+        since the previous new result has been read. False means that it may
+        be the same result again.
+
+        :return: Whether the last result is new, or None if no result of a
+                 continuous measurement has been read yet.
+        :rtype: bool/None
+        """
+        return self._last_result_new
+
+    @property
+    def result_available_at(self):
+        """
+        Get the time (see :py:func:`time.monotonic`) when a new measurement
+        result can be read. During a continuous measurement this is the time
+        of the first result after the start command, respectively 0.5ms
+        after the last new result has been read (see
+        :py:attr:`is_last_result_new`). Otherwise it is :py:attr:`ready_at`.
+
+        :rtype: float
+        """
+        if self._measurement_mode is SdpMeasurementMode.CONTINUOUS:
+            return max(self._ready_at, self._next_result_at)
+        return self._ready_at
+
+    def wait_until_ready(self):
+        """
+        Block until the sensor has finished the post processing of the last
+        command, see :py:attr:`ready_at`.
+
+        :return: The time in seconds waited.
+        :rtype: float
+        """
+        return self._wait_until(self._ready_at)
+
+    def execute(self, command):
+        """
+        Execute an I²C command on this device and keep track of the
+        measurement mode.
+
+        If the sensor is still busy with post processing of the previous
+        command, this method waits until it is ready before sending the
+        command. The post processing time of the executed command is not
+        waited for, but recorded in :py:attr:`ready_at`. If
+        :py:attr:`pace_reads` is enabled, commands reading a result of a
+        continuous measurement wait until :py:attr:`result_available_at`
+        instead.
+
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The command to be executed.
+        :return:
+            The interpreted response of the executed command.
+        :rtype:
+            Depends on the executed command.
+        """
+        continuous = self._measurement_mode is SdpMeasurementMode.CONTINUOUS
+        reading = continuous and isinstance(command, _READ_COMMANDS)
+        wait_time = self._wait_until(self.result_available_at if reading and self.pace_reads else self._ready_at)
+        if reading:
+            self._last_result_new = time.monotonic() >= self._next_result_at
+        if self.observer is None:
+            result = self._connection.execute(self._slave_address, command, False)
+        else:
+            result = self._execute_observed(command, wait_time)
+        now = time.monotonic()
+        if reading and self._last_result_new:
+            self._next_result_at = now + CONTINUOUS_UPDATE_INTERVAL
+        mode = _MODE_AFTER_COMMAND.get(type(command))
+        if mode is SdpMeasurementMode.CONTINUOUS:
+            self._invalidate_measurement_cache()
+            self._measurement_started_at = now
+            self._next_result_at = now + CONTINUOUS_FIRST_RESULT_DELAY
+            self._last_result_new = None
+        elif mode is not None:
+            self._measurement_started_at = None
+        # Instead of the (conservative) post processing time of the start
+        # command, paced reads only wait for the first result.
+        if (command.post_processing_time > 0.0) and not (self.pace_reads and mode is SdpMeasurementMode.CONTINUOUS):
+            self._ready_at = now + command.post_processing_time
+        if mode is not None:
+            self._measurement_mode = mode
+        return result
+
+    def read_product_identifier(self, refresh=False):
         """
         Read the product identifier and serial number of the sensor.
 
+        The result is cached for the connection and slave address of this
+        device, i.e. it is shared with other device objects of the same
+        sensor. Call :py:meth:`invalidate_product_identifier` when the sensor
+        may have been replaced.
+
+        :param bool refresh:
+            If True, the identifier is read from the sensor even if it is
+            cached.
         :return: The product number and serial number.
         :rtype: tuple
         """
-        self.execute(SdpI2cCmdPrepareProductIdentifier())
-        return self.execute(SdpI2cCmdReadProductIdentifier())
+        identifiers = _product_identifiers.setdefault(self._connection, {})
+        identifier = identifiers.get(self._slave_address)
+        if refresh or (identifier is None):
+            self.execute(_CMD_PREPARE_PRODUCT_IDENTIFIER)
+            identifier = self.execute(_CMD_READ_PRODUCT_IDENTIFIER)
+            identifiers[self._slave_address] = identifier
+        return identifier
+
+    def invalidate_product_identifier(self):
+        """
+        Remove the cached product identifier of this sensor, see
+        :py:meth:`read_product_identifier`.
+        """
+        _product_identifiers.get(self._connection, {}).pop(self._slave_address, None)
+
+    def read_product(self):
+        """
+        Identify the sensor and look up its capabilities in the product
+        registry (see :py:mod:`~sensirion_i2c_sdp.sdp.products`).
+
+        :return: The product, or None if the product number is unknown.
+        :rtype: ~sensirion_i2c_sdp.sdp.products.SdpProduct/None
+        """
+        product_number, _ = self.read_product_identifier()
+        return get_product(product_number)
 
     def start_continuous_measurement_with_mass_flow_t_comp_and_averaging(self):
         """
@@ -61,7 +335,7 @@ class SdpI2cDevice(I2cDevice):
                   updated every 0.5ms and can be read using the read measurement
                   interface.
         """
-        return self.execute(SdpI2cCmdStartContinuousMeasurementWithMassFlowTCompAndAveraging())
+        return self.execute(_CMD_START_MASS_FLOW_AVERAGING)
 
     def start_continuous_measurement_with_mass_flow_t_comp(self):
         """
@@ -77,7 +351,7 @@ class SdpI2cDevice(I2cDevice):
                   updated every 0.5ms and can be read using the read measurement
                   interface.
         """
-        return self.execute(SdpI2cCmdStartContinuousMeasurementWithMassFlowTComp())
+        return self.execute(_CMD_START_MASS_FLOW)
 
     def start_continuous_measurement_with_diff_pressure_t_comp_and_averaging(self):
         """
@@ -93,7 +367,7 @@ class SdpI2cDevice(I2cDevice):
                   updated every 0.5ms and can be read using the read measurement
                   interface.
         """
-        return self.execute(SdpI2cCmdStartContinuousMeasurementWithDiffPressureTCompAndAveraging())
+        return self.execute(_CMD_START_DIFF_PRESSURE_AVERAGING)
 
     def start_continuous_measurement_with_diff_pressure_t_comp(self):
         """
@@ -109,7 +383,7 @@ class SdpI2cDevice(I2cDevice):
                   updated every 0.5ms and can be read using the read measurement
                   interface.
         """
-        return self.execute(SdpI2cCmdStartContinuousMeasurementWithDiffPressureTComp())
+        return self.execute(_CMD_START_DIFF_PRESSURE)
 
     def trigger_measurement_with_mass_flow_t_comp_and_averaging(self):
         """
@@ -124,7 +398,7 @@ class SdpI2cDevice(I2cDevice):
                   45ms the result can be read out and any command can be sent to
                   the sensor.
         """
-        return self.execute(SdpI2cCmdTriggerMeasurementWithMassFlowTCompAndAveraging())
+        return self.execute(_CMD_TRIGGER_MASS_FLOW_AVERAGING)
 
     def trigger_measurement_with_diff_pressure_t_comp_and_averaging(self):
         """
@@ -139,7 +413,37 @@ class SdpI2cDevice(I2cDevice):
                   45ms the result can be read out and any command can be sent to
                   the sensor.
         """
-        return self.execute(SdpI2cCmdTriggerMeasurementWithDiffPressureTComp())
+        return self.execute(_CMD_TRIGGER_DIFF_PRESSURE)
+
+    def trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with mass flow temperature
+        compensation and read its result within a single I²C transfer, i.e.
+        the measurement time is inserted as read delay.
+
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature)
+              Temperature response object.
+        :rtype: tuple
+        """
+        return self._execute_measurement(_CMD_TRIGGER_AND_READ_MASS_FLOW_AVERAGING)
+
+    def trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with differential pressure
+        temperature compensation and read its result within a single I²C
+        transfer, i.e. the measurement time is inserted as read delay.
+
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature)
+              Temperature response object.
+        :rtype: tuple
+        """
+        return self._execute_measurement(_CMD_TRIGGER_AND_READ_DIFF_PRESSURE)
 
     def stop_continuous_measurement(self):
         """
@@ -148,7 +452,7 @@ class SdpI2cDevice(I2cDevice):
         command after 500us. The Stop command is also required when switching
         between different continuous measurement commands.
         """
-        return self.execute(SdpI2cCmdStopContinuousMeasurement())
+        return self.execute(_CMD_STOP)
 
     def read_measurement(self):
         """
@@ -157,15 +461,105 @@ class SdpI2cDevice(I2cDevice):
         After a start continuous measurement commands, the measurement results can
         be read out at most every 0.5ms. After a triggered measurement command, the
         results can be read out when the sensor is finished with the measurement.
+        This method waits for the next result if needed, see
+        :py:attr:`result_available_at`.
+
+        If the measurement mode is known (see :py:attr:`measurement_mode`),
+        the time until the sensor is ready is tracked in :py:attr:`ready_at`,
+        thus the result is read without a read delay. Only if the mode is
+        unknown (None), e.g. because the measurement was started by another
+        device object, the read is delayed by the fixed 1ms.
 
         :return:
             - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
               Differential Pressure response object
             - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature)
               Temperature response object.
+
+            On a multi-channel connection, a list containing this tuple (on
+            success) or an exception (on error) for every channel is returned
+            instead.
+        :rtype: tuple/list
+        """
+        if self._measurement_mode is not None:
+            return self._execute_measurement(_CMD_READ_MEASUREMENT_NO_DELAY)
+        return self._execute_measurement(_CMD_READ_MEASUREMENT)
+
+    def read_measurement_fast(self):
+        """
+        Read Measurement from sensor, transferring only the differential
+        pressure if possible.
+
+        The first call after starting a measurement performs a full read (see
+        :py:meth:`read_measurement`) and caches the scale factor and the
+        temperature. Subsequent calls only read the 3 bytes of the
+        differential pressure and reuse the cached values. The temperature is
+        refreshed with a full read once it is older than
+        :py:attr:`temperature_refresh_interval`. Unlike
+        :py:meth:`read_differential_pressure`, the scale factor is not taken
+        from the product registry, since the full read is needed for the
+        temperature anyway and provides the scale factor at no extra cost.
+        On a multi-channel connection, the sensors of the channels may have
+        different scale factors, thus nothing is cached and always a full
+        read is performed.
+
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature)
+              Cached temperature response object.
         :rtype: tuple
         """
-        return self.execute(SdpI2cCmdReadMeasurement())
+        if (self._scale_factor is None) or ((self.temperature_refresh_interval is not None) and (
+                time.monotonic() - self._temperature_timestamp >= self.temperature_refresh_interval)):
+            return self.read_measurement()
+        if self._measurement_mode is not None:
+            ticks = self.execute(_CMD_READ_DIFFERENTIAL_PRESSURE_NO_DELAY)
+        else:
+            ticks = self.execute(_CMD_READ_DIFFERENTIAL_PRESSURE)
+        return SdpDifferentialPressure(ticks, self._scale_factor), self._temperature
+
+    def read_differential_pressure(self):
+        """
+        Read only the differential pressure (3 bytes) from the sensor.
+
+        The scale factor is taken from the last full measurement read, or
+        from the product registry if the product identifier of the sensor has
+        been read (see :py:meth:`read_product_identifier`). If neither is
+        available, a full measurement is read.
+
+        :return: Differential Pressure response object. On a multi-channel
+                 connection, a full measurement is read and a list containing
+                 the differential pressure (on success) or an exception (on
+                 error) for every channel is returned.
+        :rtype: ~sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure/list
+        """
+        if self._connection.is_multi_channel:
+            return [r if isinstance(r, Exception) else r[0] for r in self.read_measurement()]
+        scale_factor = self._scale_factor
+        if scale_factor is None:
+            identifier = _product_identifiers.get(self._connection, {}).get(self._slave_address)
+            product = get_product(identifier[0]) if identifier is not None else None
+            if product is None:
+                return self.read_measurement()[0]
+            scale_factor = product.scale_factor
+        if self._measurement_mode is not None:
+            ticks = self.execute(_CMD_READ_DIFFERENTIAL_PRESSURE_NO_DELAY)
+        else:
+            ticks = self.execute(_CMD_READ_DIFFERENTIAL_PRESSURE)
+        return SdpDifferentialPressure(ticks, scale_factor)
+
+    def stream(self, rate=100.0, buffer_size=4096, start_measurement=None, fast=False, drop_duplicates=False):
+        """
+        Create a stream which acquires continuous measurement results in a
+        background thread. See :py:class:`~sensirion_i2c_sdp.sdp.stream.SdpStream`
+        for details about the parameters.
+
+        :return: The (not yet started) stream.
+        :rtype: ~sensirion_i2c_sdp.sdp.stream.SdpStream
+        """
+        return SdpStream(self, rate=rate, buffer_size=buffer_size, start_measurement=start_measurement, fast=fast,
+                         drop_duplicates=drop_duplicates)
 
     def enter_sleep_mode(self):
         """
@@ -182,10 +576,74 @@ class SdpI2cDevice(I2cDevice):
                   measurement command has been issued and the sensor is in idle
                   mode.
         """
-        self.execute(SdpI2cCmdEnterSleepMode())
+        self.execute(_CMD_ENTER_SLEEP)
 
     def exit_sleep_mode(self):
         """
         Exit sleep mode. See the data sheet for more detailed information
         """
-        self.execute(SdpI2cCmdExitSleepMode())
+        try:
+            self.execute(_CMD_EXIT_SLEEP)
+        except I2cNackError:
+            # The sensor does not acknowledge this command, but wakes up anyway
+            self._ready_at = time.monotonic() + _CMD_EXIT_SLEEP.post_processing_time
+            self._measurement_mode = SdpMeasurementMode.IDLE
+            raise
+
+    @staticmethod
+    def _wait_until(deadline):
+        """
+        Block until the given time (see :py:func:`time.monotonic`).
+
+        :return: The time in seconds waited.
+        """
+        delay = deadline - time.monotonic()
+        if delay > 0.0:
+            time.sleep(delay)
+            return delay
+        return 0.0
+
+    def _execute_observed(self, command, wait_time):
+        """
+        Execute a command and notify the observer about the timing and
+        result.
+        """
+        error = None
+        start = time.perf_counter()
+        try:
+            return self._connection.execute(self._slave_address, command, False)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            bus_time = max(0.0, time.perf_counter() - start - command.read_delay)
+            self.observer.on_command(self, command, bus_time, command.read_delay, wait_time, error)
+
+    def _execute_measurement(self, command):
+        """
+        Execute a command returning a measurement result and cache its scale
+        factor and temperature. On a multi-channel connection the results of
+        all channels are returned as-is without caching them.
+        """
+        result = self.execute(command)
+        if not self._connection.is_multi_channel:
+            self._update_measurement_cache(*result)
+        return result
+
+    def _update_measurement_cache(self, differential_pressure, temperature):
+        """
+        Cache the scale factor and temperature of a full measurement read for
+        :py:meth:`read_measurement_fast`.
+        """
+        self._scale_factor = differential_pressure.scale_factor
+        self._temperature = temperature
+        self._temperature_timestamp = time.monotonic()
+
+    def _invalidate_measurement_cache(self):
+        """
+        Forget the scale factor and temperature cached by
+        :py:meth:`read_measurement_fast`.
+        """
+        self._scale_factor = None
+        self._temperature = None
+        self._temperature_timestamp = None
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Discovery of SDP sensors connected to one or more I²C buses.
+
+.. sourcecode:: python
+
+    connections = [I2cConnection(LinuxI2cTransceiver(bus)) for bus in ('/dev/i2c-1', '/dev/i2c-2')]
+    for sdp in discover_devices(connections):
+        product = sdp.read_product()  # cached, no I²C communication
+        print(sdp.slave_address, product.name if product else "unknown")
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from sensirion_i2c_driver.errors import I2cError
+
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.products import get_products
+
+log = logging.getLogger(__name__)
+
+
+def get_slave_addresses():
+    """
+    Get all I²C slave addresses supported by the registered products.
+
+    :return: The addresses in ascending order, e.g. 0x21 to 0x23 (SDP3x) and
+             0x25, 0x26 (SDP8xx).
+    :rtype: list(int)
+    """
+    return sorted(set(address for product in get_products() for address in product.slave_addresses))
+
+
+def probe_connection(connection, slave_addresses=None):
+    """
+    Probe the given addresses on a single connection one after the other.
+
+    A sensor is detected if it answers the product identifier commands, thus
+    sensors in continuous measurement or sleep mode are not detected.
+
+    :param ~sensirion_i2c_driver.connection.I2cConnection connection:
+        The (single channel) I²C connection to probe.
+    :param list(int) slave_addresses:
+        The addresses to probe. Defaults to :py:func:`get_slave_addresses`.
+    :return: The detected devices, with their product identifier cached.
+    :rtype: list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice)
+    """
+    if slave_addresses is None:
+        slave_addresses = get_slave_addresses()
+    devices = []
+    for slave_address in slave_addresses:
+        device = SdpI2cDevice(connection, slave_address)
+        try:
+            device.read_product_identifier(refresh=True)
+        except I2cError as e:
+            log.debug("No SDP sensor detected at address 0x{:02X}: {}".format(slave_address, e))
+            continue
+        devices.append(device)
+    return devices
+
+
+def discover_devices(connections, slave_addresses=None, max_workers=None):
+    """
+    Probe the given addresses on several connections. Since the devices on a
+    bus have to be probed one after the other, but different buses (e.g.
+    the ports of several SensorBridges) are independent, the connections are
+    probed concurrently.
+
+    :param list(~sensirion_i2c_driver.connection.I2cConnection) connections:
+        The (single channel) I²C connections to probe.
+    :param list(int) slave_addresses:
+        The addresses to probe. Defaults to :py:func:`get_slave_addresses`.
+    :param int max_workers:
+        Maximum number of connections probed at the same time. Defaults to
+        all connections.
+    :return:
+        The detected devices, ordered by connection and address, with their
+        product identifier cached (see
+        :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_product`).
+    :rtype: list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice)
+    """
+    connections = list(connections)
+    if not connections:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers or len(connections)) as executor:
+        futures = [executor.submit(probe_connection, connection, slave_addresses) for connection in connections]
+        return [device for future in futures for device in future.result()]
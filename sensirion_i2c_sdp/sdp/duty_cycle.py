@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Duty cycling of battery operated sensors, which sleep between single shot
+measurements.
+
+.. sourcecode:: python
+
+    scheduler = SdpDutyCycleScheduler([SdpI2cDevice(connection, address) for address in (0x21, 0x22)],
+                                      period=1.0)
+    for timestamp, results in scheduler.measurements():
+        for result in results:
+            if not isinstance(result, Exception):
+                differential_pressure, temperature = result
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+import threading
+import time
+
+from sensirion_i2c_driver.errors import I2cError, I2cNackError
+
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+
+log = logging.getLogger(__name__)
+
+
+class SdpDutyCycleScheduler(object):
+    """
+    Measures a group of sensors periodically and keeps them in sleep mode
+    between the measurements.
+
+    Every cycle wakes all sensors back to back, triggers the measurements as
+    soon as the sensors are awake (2ms after the wake-up), reads every
+    result as soon as its measurement is done and puts every sensor back to
+    sleep right after reading it. Thus all sensors measure in parallel,
+    and every sensor is awake only for about 50ms per cycle.
+
+    The wake-up command is not acknowledged by a sleeping sensor, so the
+    resulting :py:class:`~sensirion_i2c_driver.errors.I2cNackError` is
+    ignored. Idle sensors (e.g. on the first cycle) are woken up the same
+    way without harm, and a running continuous measurement is stopped, since
+    triggered measurements and sleep mode are only possible from idle mode.
+    """
+
+    def __init__(self, devices, period=1.0, mass_flow=False):
+        """
+        Creates a scheduler.
+
+        :param list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice) devices:
+            The devices to measure.
+        :param float period:
+            The sample period in seconds.
+        :param bool mass_flow:
+            If True, measure with mass flow temperature compensation instead
+            of differential pressure temperature compensation.
+        """
+        super(SdpDutyCycleScheduler, self).__init__()
+        if period <= 0:
+            raise ValueError("The sample period must be positive.")
+        self._devices = list(devices)
+        self._period = period
+        self._mass_flow = mass_flow
+        self._awake_times = [0.0] * len(self._devices)
+        self._cycle_count = 0
+        self._stop_event = threading.Event()
+
+    @property
+    def devices(self):
+        """
+        Get the devices of this scheduler.
+
+        :rtype: list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice)
+        """
+        return self._devices
+
+    @property
+    def awake_times(self):
+        """
+        The total time in seconds every device has been awake in the cycles
+        executed so far, measured from its wake-up command to its sleep
+        command.
+
+        :type: list(float)
+        """
+        return list(self._awake_times)
+
+    @property
+    def cycle_count(self):
+        """
+        Number of executed cycles.
+
+        :type: int
+        """
+        return self._cycle_count
+
+    def measure(self):
+        """
+        Execute a single cycle: wake up, measure and put back to sleep all
+        devices.
+
+        :return:
+            For every device either a tuple of the differential pressure and
+            temperature response objects, or the raised exception.
+        :rtype: list
+        """
+        results = [None] * len(self._devices)
+        woken_at = [None] * len(self._devices)
+        for i, device in enumerate(self._devices):
+            woken_at[i] = time.monotonic()
+            try:
+                self._wake_up(device)
+            except I2cError as e:
+                results[i] = e
+        for i, device in enumerate(self._devices):
+            if results[i] is None:
+                try:
+                    if self._mass_flow:
+                        device.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+                    else:
+                        device.trigger_measurement_with_diff_pressure_t_comp_and_averaging()
+                except I2cError as e:
+                    results[i] = e
+        for i, device in enumerate(self._devices):
+            if results[i] is None:
+                try:
+                    results[i] = device.read_measurement()
+                except I2cError as e:
+                    results[i] = e
+            self._sleep(device)
+            self._awake_times[i] += time.monotonic() - woken_at[i]
+        self._cycle_count += 1
+        return results
+
+    def measurements(self, count=None):
+        """
+        Execute cycles at the configured sample period, scheduled on absolute
+        deadlines. If a cycle takes longer than the period, the next cycle
+        starts immediately without trying to catch up.
+
+        :param int/None count:
+            Number of cycles to execute, or None to run until :py:meth:`stop`
+            is called.
+        :return:
+            A generator yielding the start time (see :py:func:`time.monotonic`)
+            and the results (see :py:meth:`measure`) of every cycle.
+        """
+        self._stop_event.clear()
+        next_time = time.monotonic()
+        executed = 0
+        while ((count is None) or (executed < count)) and not self._stop_event.is_set():
+            timestamp = time.monotonic()
+            yield timestamp, self.measure()
+            executed += 1
+            next_time += self._period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                if (count is None) or (executed < count):
+                    self._stop_event.wait(delay)
+            else:
+                next_time = time.monotonic()
+
+    def stop(self):
+        """
+        Stop :py:meth:`measurements` after the current cycle, e.g. from
+        another thread.
+        """
+        self._stop_event.set()
+
+    @staticmethod
+    def _wake_up(device):
+        if device.measurement_mode is SdpMeasurementMode.CONTINUOUS:
+            # Not sleeping, but must be idle to trigger a measurement
+            device.stop_continuous_measurement()
+            return
+        try:
+            device.exit_sleep_mode()
+        except I2cNackError:
+            pass  # expected, the device handles the wake-up time
+
+    @staticmethod
+    def _sleep(device):
+        try:
+            device.enter_sleep_mode()
+        except I2cError as e:
+            log.warning("Failed to put SDP at address 0x{:02X} to sleep: {}".format(device.slave_address, e))
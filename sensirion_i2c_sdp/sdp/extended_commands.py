@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Hand-written SDP I²C commands complementing the generated commands in
+:py:mod:`~sensirion_i2c_sdp.sdp.commands` (which must not be edited
+manually). They are optimized for the measurement hot path: The CRCs are
+checked with lookup tables (see :py:mod:`~sensirion_i2c_sdp.sdp.crc`), and
+the commands transfer fewer bytes or need fewer transfers than their
+generated counterparts.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from struct import unpack
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdBase, SdpI2cCmdReadMeasurement
+from sensirion_i2c_sdp.sdp.crc import strip_crc
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure, SdpTemperature
+
+
+class SdpI2cCmdExtendedBase(SdpI2cCmdBase):
+    """
+    SDP I²C base command of the hand-written commands, which checks the CRCs
+    of the received data with lookup tables.
+    """
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the data with all CRCs removed.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The received bytes, or None if there is no data received.
+        :rtype:
+            bytes or None
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        return strip_crc(data)
+
+
+class SdpI2cCmdReadMeasurementFast(SdpI2cCmdReadMeasurement):
+    """
+    Read Measurement I²C Command with a configurable read delay
+
+    Same as :py:class:`~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdReadMeasurement`,
+    but the read delay can be omitted if the time until the sensor is ready
+    is known, and the response is decoded with lookup tables.
+    """
+
+    def __init__(self, read_delay=0.001):
+        """
+        Constructor.
+
+        :param float read_delay:
+            Delay (in Seconds) between the write and the read operation.
+            Defaults to 1ms, which is not needed if the time until the sensor
+            is ready is known, e.g. during a continuous measurement.
+        """
+        super(SdpI2cCmdReadMeasurementFast, self).__init__()
+        self.read_delay = float(read_delay)
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the interpreted data.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure) -
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature) -
+              Temperature response object.
+        :rtype: tuple
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        differential_pressure_ticks, temperature_ticks, scaling_factor = unpack(">hhh", strip_crc(data))  # 3x int16
+        return SdpDifferentialPressure(differential_pressure_ticks, scaling_factor), SdpTemperature(temperature_ticks)
+
+
+class SdpI2cCmdReadProductIdentifierFast(SdpI2cCmdExtendedBase):
+    """
+    Read Product Identifier I²C Command
+
+    Same as :py:class:`~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdReadProductIdentifier`,
+    but the response is decoded with lookup tables.
+
+    .. note:: Make sure to call 'prepare product identifier' immediately
+              before.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        super(SdpI2cCmdReadProductIdentifierFast, self).__init__(
+            command=0xE102,
+            tx_data=None,
+            rx_length=18,
+            read_delay=0.001,
+            timeout=0,
+            post_processing_time=0.0,
+        )
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the interpreted data.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            - product_number (int) -
+              32 bit unique product and revision number. The number is listed
+              in the datasheet. Note that the last 8 bits are the revision
+              number and can be subject to change.
+            - serial_number (unsigned long long) 64-bit unique serial number
+        :rtype: tuple
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        checked_data = SdpI2cCmdExtendedBase.interpret_response(self, data)
+        product_number, serial_number = unpack(">IQ", checked_data)  # uint32, uint64
+        return int(product_number), int(serial_number)
+
+
+class SdpI2cCmdReadDifferentialPressure(SdpI2cCmdExtendedBase):
+    """
+    Read Differential Pressure I²C Command
+
+    Reads only the differential pressure word of a measurement, i.e. the read
+    sequence is aborted with a NACK and a STOP condition after the first 3
+    bytes. Temperature and scale factor are not transferred, which reduces
+    the bus time to a third of a full read measurement.
+    """
+
+    def __init__(self, read_delay=0.001):
+        """
+        Constructor.
+
+        :param float read_delay:
+            Delay (in Seconds) between the write and the read operation.
+            Defaults to 1ms, which is not needed if the time until the sensor
+            is ready is known, e.g. during a continuous measurement.
+        """
+        super(SdpI2cCmdReadDifferentialPressure, self).__init__(
+            command=None,
+            tx_data=None,
+            rx_length=3,
+            read_delay=read_delay,
+            timeout=0,
+            post_processing_time=0.0,
+        )
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the interpreted data.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            The digital calibrated differential pressure signal (ticks) as a
+            signed integer number. It has to be divided by the scale factor of
+            a full measurement read to get the physical value in Pascal.
+        :rtype: int
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        checked_data = SdpI2cCmdExtendedBase.interpret_response(self, data)
+        return unpack(">h", checked_data)[0]  # int16
+
+
+class SdpI2cCmdTriggerAndReadMeasurement(SdpI2cCmdExtendedBase):
+    """
+    Trigger And Read Measurement I²C Command
+
+    Combines a trigger measurement command and the read measurement command
+    into a single transfer: The trigger command is written, and after the
+    measurement time has elapsed (inserted as read delay) the measurement
+    results are read. This saves one round trip compared to executing both
+    commands separately.
+    """
+
+    def __init__(self, trigger_command):
+        """
+        Constructor.
+
+        :param ~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdBase trigger_command:
+            The trigger measurement command to execute, e.g.
+            :py:class:`~sensirion_i2c_sdp.sdp.commands.SdpI2cCmdTriggerMeasurementWithDiffPressureTComp`.
+            Its post processing time is used as read delay.
+        """
+        super(SdpI2cCmdTriggerAndReadMeasurement, self).__init__(
+            command=unpack(">H", trigger_command.tx_data)[0],
+            tx_data=None,
+            rx_length=9,
+            read_delay=trigger_command.post_processing_time,
+            timeout=0,
+            post_processing_time=0.0,
+        )
+
+    def interpret_response(self, data):
+        """
+        Validates the CRCs of the received data from the device and returns
+        the interpreted data.
+
+        :param bytes data:
+            Received raw bytes from the read operation.
+        :return:
+            - differential_pressure (:py:class:sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure) -
+              Differential Pressure response object
+            - temperature (:py:class:sensirion_i2c_sdp.sdp.reasponse_types.SdpTemperature) -
+              Temperature response object.
+        :rtype: tuple
+        :raise ~sensirion_i2c_driver.errors.I2cChecksumError:
+            If a received CRC was wrong.
+        """
+        checked_data = SdpI2cCmdExtendedBase.interpret_response(self, data)
+        differential_pressure_ticks, temperature_ticks, scaling_factor = unpack(">hhh", checked_data)  # 3x int16
+        return SdpDifferentialPressure(differential_pressure_ticks, scaling_factor), SdpTemperature(temperature_ticks)
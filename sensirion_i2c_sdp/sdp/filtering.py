@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Streaming low-pass filtering and decimation of differential pressure
+samples, computed chunk-wise with NumPy.
+
+.. sourcecode:: python
+
+    # 2kHz from the sensor, 100Hz to the application
+    lowpass = SdpFilter(lowpass_fir(cutoff=40.0, sample_rate=2000.0), decimation=20)
+    with sdp.stream(rate=2000.0) as stream:
+        while True:
+            filtered = lowpass.process_samples(stream.read())
+            for differential_pressure in filtered.to_differential_pressures():
+                print(differential_pressure.pascal)
+            time.sleep(0.1)
+
+FIR filters only require NumPy, which can be installed with
+``pip install sensirion-i2c-sdp[numpy]``. IIR filters (e.g. designed with
+:py:func:`scipy.signal.butter`) additionally require SciPy
+(``pip install sensirion-i2c-sdp[scipy]``).
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from scipy.signal import lfilter, lfilter_zi
+except ImportError:  # pragma: no cover
+    lfilter = lfilter_zi = None
+
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure
+
+
+class SdpFilteredSamples(namedtuple('SdpFilteredSamples', [
+    'timestamps',
+    'pascal',
+    'differential_pressure_ticks',
+    'scale_factor',
+])):
+    """
+    Filtered and decimated samples. ``timestamps``, ``pascal`` and
+    ``differential_pressure_ticks`` (the filtered pressure rounded to ticks)
+    are NumPy arrays. ``scale_factor`` is the scale factor of the input
+    samples.
+    """
+    __slots__ = ()
+
+    def to_differential_pressures(self):
+        """
+        Convert the samples to response objects.
+
+        :rtype: list(~sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure)
+        """
+        return [SdpDifferentialPressure(ticks, self.scale_factor)
+                for ticks in self.differential_pressure_ticks.tolist()]
+
+
+def moving_average(length):
+    """
+    Get the coefficients of a moving average FIR filter.
+
+    :param int length: Number of averaged samples.
+    :rtype: numpy.ndarray
+    """
+    if np is None:
+        raise ImportError("NumPy is required for filtering.")
+    return np.full(length, 1.0 / length)
+
+
+def lowpass_fir(cutoff, sample_rate, taps=31):
+    """
+    Design a windowed-sinc (Hamming) low-pass FIR filter with unity gain.
+
+    :param float cutoff: The cutoff frequency in Hz.
+    :param float sample_rate: The sample rate in Hz.
+    :param int taps: Number of coefficients.
+    :rtype: numpy.ndarray
+    """
+    if np is None:
+        raise ImportError("NumPy is required for filtering.")
+    if not 0 < cutoff < sample_rate / 2.0:
+        raise ValueError("The cutoff frequency must be between 0 and half the sample rate.")
+    n = np.arange(taps) - (taps - 1) / 2.0
+    coefficients = np.sinc(2.0 * cutoff / sample_rate * n) * np.hamming(taps)
+    return coefficients / coefficients.sum()
+
+
+class SdpFilter(object):
+    """
+    Filter and decimate a stream of differential pressure samples.
+
+    The samples are processed in chunks of any size, the filter state is
+    kept between the chunks. Thus the result does not depend on how the
+    stream is split into chunks. The filter state is initialized with the
+    first sample to avoid a start-up transient. The timestamps are
+    decimated like the samples, without compensating the group delay of
+    the filter.
+    """
+
+    def __init__(self, b, a=None, decimation=1):
+        """
+        Creates a filter.
+
+        :param array-like b: The numerator (FIR) coefficients.
+        :param array-like a:
+            The denominator coefficients of an IIR filter, or None for a FIR
+            filter. Requires SciPy.
+        :param int decimation: Only every n-th filtered sample is returned.
+        """
+        super(SdpFilter, self).__init__()
+        if np is None:
+            raise ImportError("NumPy is required for filtering.")
+        if decimation < 1:
+            raise ValueError("The decimation must be at least 1.")
+        if (a is not None) and (lfilter is None):
+            raise ImportError("SciPy is required for IIR filters.")
+        self._b = np.asarray(b, dtype=np.float64)
+        self._a = None if a is None else np.asarray(a, dtype=np.float64)
+        self._decimation = decimation
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the filter state, e.g. after a gap in the stream.
+        """
+        self._state = None
+        self._phase = 0  # index of the next returned sample in the next chunk
+
+    def process(self, timestamps, differential_pressure_ticks, scale_factor):
+        """
+        Process a chunk of samples.
+
+        :param array-like timestamps: The timestamps of the samples.
+        :param array-like differential_pressure_ticks: The raw ticks.
+        :param int scale_factor: The differential pressure scale factor.
+        :rtype: SdpFilteredSamples
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        pascal = np.asarray(differential_pressure_ticks, dtype=np.float64) / scale_factor
+        if len(pascal):
+            pascal = self._filter(pascal)
+        indices = slice(self._phase, None, self._decimation)
+        self._phase = (self._phase - len(pascal)) % self._decimation
+        pascal = pascal[indices]
+        ticks = np.clip(np.rint(pascal * scale_factor), -32768, 32767).astype(np.int16)
+        return SdpFilteredSamples(timestamps[indices], pascal, ticks, scale_factor)
+
+    def process_samples(self, samples):
+        """
+        Process a chunk of samples as read from
+        :py:class:`~sensirion_i2c_sdp.sdp.stream.SdpStream`. The scale factor
+        is taken from the first sample.
+
+        :param list samples:
+            The samples, with the attributes ``timestamp``,
+            ``differential_pressure_ticks`` and ``scale_factor``.
+        :rtype: SdpFilteredSamples
+        """
+        if not samples:
+            return self.process([], [], 1)
+        timestamps = np.fromiter((s.timestamp for s in samples), np.float64, len(samples))
+        ticks = np.fromiter((s.differential_pressure_ticks for s in samples), np.int16, len(samples))
+        return self.process(timestamps, ticks, samples[0].scale_factor)
+
+    def _filter(self, x):
+        if self._a is None:
+            if self._state is None:
+                self._state = np.full(len(self._b) - 1, x[0])
+            extended = np.concatenate((self._state, x))
+            self._state = extended[len(extended) - (len(self._b) - 1):]
+            return np.convolve(extended, self._b, 'valid')
+        if self._state is None:
+            self._state = lfilter_zi(self._b, self._a) * x[0]
+        y, self._state = lfilter(self._b, self._a, x, zi=self._state)
+        return y
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Acquisition of continuous measurements from many sensors, distributed over
+several worker processes.
+
+Every worker process owns a shard of the sensors, e.g. all sensors behind
+one SensorBridge. It opens the connection itself by calling a factory
+function, reads the sensors at the configured rate and sends the raw
+samples in compact binary batches back to the main process through a pipe.
+Since the workers neither share the GIL nor wait for each other's serial
+I/O, the throughput scales with the number of cores.
+
+.. sourcecode:: python
+
+    def open_bridge(serial_port):
+        # Called in the worker process. The port stays open until the
+        # worker terminates.
+        port = ShdlcSerialPort(port=serial_port, baudrate=460800)
+        bridge = SensorBridgeShdlcDevice(ShdlcConnection(port), slave_address=0)
+        ...
+        connection = I2cConnection(SensorBridgeI2cProxy(bridge, port=SensorBridgePort.ONE))
+        return [SdpI2cDevice(connection, address) for address in (0x21, 0x22, 0x23)]
+
+    factories = [functools.partial(open_bridge, port) for port in ('COM1', 'COM2')]
+    with SdpFleet(factories, rate=200.0) as fleet:
+        while True:
+            for sample in fleet.read(timeout=1.0):
+                print(sample.shard, sample.device, sample.differential_pressure_ticks)
+
+The factories are passed to the worker processes, thus they must be
+picklable (e.g. module level functions or :py:func:`functools.partial`
+thereof) if the ``spawn`` or ``forkserver`` start method is used.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+import multiprocessing
+import struct
+import time
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+from sensirion_i2c_driver.errors import I2cError
+
+log = logging.getLogger(__name__)
+
+# Batch message types
+_DATA = b"D"
+_ERROR = b"E"
+
+# Batch header: number of samples, number of failed reads
+_BATCH_HEADER = struct.Struct("<II")
+
+#: Binary format of a single sample in a batch: timestamp (float64), device
+#: index within the shard (uint16), differential pressure ticks, temperature
+#: ticks and scale factor (int16 each), little endian without padding, i.e.
+#: 16 bytes per sample.
+SAMPLE_FORMAT = struct.Struct("<dHhhh")
+
+#: A single sample acquired by :py:class:`SdpFleet`. The timestamp is taken
+#: from :py:func:`time.monotonic` in the worker process, which is comparable
+#: between processes. ``shard`` is the index of the factory and ``device``
+#: the index of the device in the list returned by the factory.
+SdpFleetSample = namedtuple('SdpFleetSample', [
+    'timestamp',
+    'shard',
+    'device',
+    'differential_pressure_ticks',
+    'temperature_ticks',
+    'scale_factor',
+])
+
+
+def decode_batch(shard, data):
+    """
+    Decode the samples of a batch.
+
+    :param int shard: The index of the shard the batch was received from.
+    :param bytes data: The binary samples, see :py:data:`SAMPLE_FORMAT`.
+    :return: The decoded samples.
+    :rtype: list(SdpFleetSample)
+    """
+    return [SdpFleetSample(timestamp, shard, device, dp, temperature, scale_factor)
+            for timestamp, device, dp, temperature, scale_factor in SAMPLE_FORMAT.iter_unpack(data)]
+
+
+def _run_worker(factory, rate, batch_interval, start_measurement, pipe, stop_event):
+    """
+    Entry point of a worker process.
+    """
+    devices = []
+    try:
+        devices = factory()
+        for device in devices:
+            getattr(device, start_measurement)()
+        period = 1.0 / rate
+        samples = bytearray()
+        sample_count = 0
+        error_count = 0
+        next_time = time.monotonic()
+        next_batch_time = next_time + batch_interval
+        while not stop_event.is_set():
+            for index, device in enumerate(devices):
+                try:
+                    differential_pressure, temperature = device.read_measurement()
+                except I2cError:
+                    error_count += 1
+                    continue
+                samples += SAMPLE_FORMAT.pack(time.monotonic(), index, differential_pressure.ticks,
+                                              temperature.ticks, differential_pressure.scale_factor)
+                sample_count += 1
+            now = time.monotonic()
+            if now >= next_batch_time:
+                pipe.send_bytes(_DATA + _BATCH_HEADER.pack(sample_count, error_count) + bytes(samples))
+                samples = bytearray()
+                sample_count = error_count = 0
+                next_batch_time = now + batch_interval
+            next_time += period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                stop_event.wait(delay)
+            else:
+                next_time = time.monotonic()
+        pipe.send_bytes(_DATA + _BATCH_HEADER.pack(sample_count, error_count) + bytes(samples))
+    except Exception as e:
+        pipe.send_bytes(_ERROR + "{}: {}".format(type(e).__name__, e).encode('utf-8'))
+    finally:
+        for device in devices:
+            try:
+                device.stop_continuous_measurement()
+            except Exception:
+                pass
+        pipe.close()
+
+
+class SdpFleet(object):
+    """
+    Continuous measurement of many sensors in several worker processes, see
+    :py:mod:`~sensirion_i2c_sdp.sdp.fleet`.
+    """
+
+    def __init__(self, factories, rate=100.0, batch_interval=0.1,
+                 start_measurement='start_continuous_measurement_with_diff_pressure_t_comp', context=None):
+        """
+        Creates a fleet (the workers are not started yet).
+
+        :param list(callable) factories:
+            One factory per worker process. A factory is called in the worker
+            process and returns the list of
+            :py:class:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice` to read.
+        :param float rate:
+            Target sample rate in Hz per sensor.
+        :param float batch_interval:
+            Interval in seconds at which the workers send their samples.
+        :param str start_measurement:
+            Name of the device method which starts the continuous
+            measurement.
+        :param context:
+            The :py:mod:`multiprocessing` context to create the workers with.
+            Defaults to the default context.
+        """
+        super(SdpFleet, self).__init__()
+        if rate <= 0:
+            raise ValueError("The sample rate must be positive.")
+        self._factories = list(factories)
+        self._rate = rate
+        self._batch_interval = batch_interval
+        self._start_measurement = start_measurement
+        self._context = context or multiprocessing.get_context()
+        self._processes = []
+        self._readers = {}
+        self._stop_event = None
+        self._pending_batches = []  # received, but not yet read
+        self._error_count = 0
+        self._worker_errors = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def is_running(self):
+        """
+        Check whether any worker process is running.
+
+        :type: bool
+        """
+        return any(process.is_alive() for process in self._processes)
+
+    @property
+    def error_count(self):
+        """
+        Number of failed read operations in all workers.
+
+        :type: int
+        """
+        return self._error_count
+
+    @property
+    def worker_errors(self):
+        """
+        Descriptions of the exceptions which terminated worker processes,
+        as tuples of the shard index and the message.
+
+        :type: list(tuple)
+        """
+        return list(self._worker_errors)
+
+    def start(self):
+        """
+        Start the worker processes.
+        """
+        if self._processes:
+            raise RuntimeError("The fleet is already running.")
+        self._stop_event = self._context.Event()
+        for shard, factory in enumerate(self._factories):
+            reader, writer = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_run_worker, name="SdpFleet-{}".format(shard),
+                args=(factory, self._rate, self._batch_interval, self._start_measurement, writer,
+                      self._stop_event))
+            process.daemon = True
+            process.start()
+            writer.close()  # only the worker writes
+            self._processes.append(process)
+            self._readers[reader] = shard
+
+    def stop(self):
+        """
+        Stop the worker processes. Samples which were not read yet can still
+        be read afterwards.
+        """
+        if not self._processes:
+            return
+        self._stop_event.set()
+        # Drain the pipes before joining, otherwise workers could block on a
+        # full pipe.
+        while self._readers:
+            self._pending_batches.extend(self._receive(None))
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def read_batches(self, timeout=0.0):
+        """
+        Receive the binary sample batches sent by the workers, without
+        decoding them.
+
+        :param float/None timeout:
+            Maximum time in seconds to wait for a batch, or None to wait
+            until a batch is received or all workers terminated.
+        :return: Tuples of the shard index and the samples (see
+                 :py:data:`SAMPLE_FORMAT`).
+        :rtype: list(tuple)
+        """
+        batches, self._pending_batches = self._pending_batches, []
+        return batches + self._receive(0.0 if batches else timeout)
+
+    def read(self, timeout=0.0):
+        """
+        Receive and decode the samples sent by the workers.
+
+        :param float/None timeout:
+            Maximum time in seconds to wait for samples, or None to wait
+            until samples are received or all workers terminated.
+        :return: The samples.
+        :rtype: list(SdpFleetSample)
+        """
+        samples = []
+        for shard, data in self.read_batches(timeout):
+            samples.extend(decode_batch(shard, data))
+        return samples
+
+    def _receive(self, timeout):
+        batches = []
+        if not self._readers:
+            return batches
+        for reader in wait(list(self._readers), timeout):
+            shard = self._readers[reader]
+            try:
+                while True:
+                    message = reader.recv_bytes()
+                    if message[:1] == _ERROR:
+                        error = message[1:].decode('utf-8')
+                        log.error("SdpFleet worker {} failed: {}".format(shard, error))
+                        self._worker_errors.append((shard, error))
+                    else:
+                        _, error_count = _BATCH_HEADER.unpack_from(message, 1)
+                        self._error_count += error_count
+                        batches.append((shard, message[1 + _BATCH_HEADER.size:]))
+                    if not reader.poll():
+                        break
+            except EOFError:
+                reader.close()
+                del self._readers[reader]
+        return batches
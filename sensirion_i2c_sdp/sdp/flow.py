@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Conversion of differential pressure measurements into flow with
+precomputed lookup tables.
+
+The flow through a flow element (e.g. an orifice, a venturi tube or a
+bypass configuration) is modelled as
+
+.. math::
+
+    Q = gain \\cdot sign(\\Delta p) \\cdot |\\Delta p|^{exponent}
+        \\cdot \\left(\\frac{T}{T_{ref}}\\right)^{temperature\\_exponent}
+
+with the differential pressure in Pa and the absolute temperatures in K.
+For an orifice or venturi the exponent is 0.5, for a laminar flow element
+it is 1. When measuring with mass flow temperature compensation the sensor
+already compensates the density of the gas, so the temperature exponent is
+0 and the flow is mass flow. To get volumetric flow of an orifice from a
+measurement with differential pressure temperature compensation, use a
+temperature exponent of 0.5.
+
+Since the sensor only provides 65536 different differential pressure
+values, the pressure term without the gain is precomputed for every tick
+value once per exponent and scale factor (and the temperature term for
+every temperature tick once per temperature exponent and reference
+temperature). Converting a sample is then a table lookup and a
+multiplication with the gain, and converting arrays of ticks is a
+vectorized NumPy indexing operation. Flow elements which differ only in
+their gain (e.g. calibrated individually) share their tables. Only the
+most recently used tables are kept, since every table needs 512kB.
+
+.. sourcecode:: python
+
+    converter = SdpFlowConverter(SdpFlowElement(gain=0.9, exponent=0.5))  # e.g. in slm
+    differential_pressure, temperature = sdp.read_measurement()
+    flow = converter.convert(differential_pressure, temperature)
+
+    frames = decode_measurement_frames(data)
+    flows = converter.convert_ticks(frames.differential_pressure_ticks, frames.scale_factor,
+                                    frames.temperature_ticks, frames.valid)
+
+This module requires NumPy, which can be installed with
+``pip install sensirion-i2c-sdp[numpy]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+from collections import OrderedDict, namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_ZERO_CELSIUS = 273.15
+
+# Maximum number of cached lookup tables of each kind
+_MAX_TABLES = 16
+
+# Lookup tables by exponent and scale factor (pressure tables), resp. by
+# temperature exponent and reference temperature (temperature tables), the
+# least recently used first
+_pressure_tables = OrderedDict()
+_temperature_tables = OrderedDict()
+_tables_lock = threading.Lock()
+
+
+class SdpFlowElement(namedtuple('SdpFlowElement', [
+    'gain',
+    'exponent',
+    'temperature_exponent',
+    'reference_temperature',
+])):
+    """
+    Characteristic of a flow element, see :py:mod:`~sensirion_i2c_sdp.sdp.flow`.
+
+    :param float gain: Flow at 1 Pa and the reference temperature.
+    :param float exponent: Exponent of the differential pressure.
+    :param float temperature_exponent:
+        Exponent of the temperature correction, 0 to disable it.
+    :param float reference_temperature:
+        Reference temperature in °C of the temperature correction.
+    """
+    __slots__ = ()
+
+    def __new__(cls, gain, exponent=0.5, temperature_exponent=0.0, reference_temperature=20.0):
+        return super(SdpFlowElement, cls).__new__(cls, float(gain), float(exponent), float(temperature_exponent),
+                                                  float(reference_temperature))
+
+
+def _all_ticks():
+    # Every int16 value, ordered by its uint16 representation
+    return np.arange(65536, dtype=np.uint16).view(np.int16)
+
+
+def _get_table(tables, key, compute):
+    with _tables_lock:
+        table = tables.pop(key, None)
+        if table is not None:
+            tables[key] = table  # mark as most recently used
+            return table
+    table = compute()
+    table.flags.writeable = False
+    with _tables_lock:
+        table = tables.setdefault(key, table)
+        while len(tables) > _MAX_TABLES:
+            tables.popitem(last=False)
+    return table
+
+
+def _get_pressure_table(element, scale_factor):
+    if scale_factor <= 0:
+        raise ValueError("Invalid scale factor {}.".format(scale_factor))
+
+    def compute():
+        pascal = _all_ticks().astype(np.float64) / scale_factor
+        return np.sign(pascal) * np.abs(pascal) ** element.exponent
+    return _get_table(_pressure_tables, (element.exponent, scale_factor), compute)
+
+
+def _get_temperature_table(element):
+    def compute():
+        kelvin = _all_ticks().astype(np.float64) / 200. + _ZERO_CELSIUS
+        reference = element.reference_temperature + _ZERO_CELSIUS
+        with np.errstate(invalid='ignore'):
+            return (np.maximum(kelvin, 0.0) / reference) ** element.temperature_exponent
+    return _get_table(_temperature_tables, (element.temperature_exponent, element.reference_temperature), compute)
+
+
+class SdpFlowConverter(object):
+    """
+    Converts measurements into flow for a flow element. The lookup tables
+    are computed on first use of a scale factor and are shared by all
+    converters of flow elements with the same exponents.
+    """
+
+    def __init__(self, element):
+        """
+        Creates a converter.
+
+        :param SdpFlowElement element: The flow element.
+        :raise ImportError: If NumPy is not installed.
+        """
+        super(SdpFlowConverter, self).__init__()
+        if np is None:
+            raise ImportError("NumPy is required for flow conversion.")
+        self._element = element
+        self._uses_temperature = element.temperature_exponent != 0.0
+
+    @property
+    def element(self):
+        """
+        Get the flow element.
+
+        :rtype: SdpFlowElement
+        """
+        return self._element
+
+    def convert(self, differential_pressure, temperature=None):
+        """
+        Convert a single measurement.
+
+        :param ~sensirion_i2c_sdp.sdp.response_types.SdpDifferentialPressure differential_pressure:
+            The differential pressure.
+        :param ~sensirion_i2c_sdp.sdp.response_types.SdpTemperature temperature:
+            The temperature. Only required if the flow element has a
+            temperature correction.
+        :return: The flow.
+        :rtype: float
+        :raise ValueError:
+            If the scale factor is not positive, or if the flow element has a
+            temperature correction, but no temperature is given.
+        """
+        flow = self._element.gain * _get_pressure_table(self._element, differential_pressure.scale_factor)[
+            differential_pressure.ticks & 0xFFFF]
+        if self._uses_temperature:
+            if temperature is None:
+                raise ValueError("The flow element has a temperature correction, thus a temperature is required.")
+            flow *= _get_temperature_table(self._element)[temperature.ticks & 0xFFFF]
+        return float(flow)
+
+    def convert_ticks(self, differential_pressure_ticks, scale_factor, temperature_ticks=None, valid=None):
+        """
+        Convert arrays of raw ticks, e.g. from
+        :py:func:`~sensirion_i2c_sdp.sdp.decoding.decode_measurement_frames`
+        or :py:class:`~sensirion_i2c_sdp.sdp.recording.SdpRecordingReader`.
+
+        :param array-like differential_pressure_ticks: The differential pressure ticks.
+        :param int/array-like scale_factor:
+            The scale factor of all samples, or an array with the scale
+            factor of every sample. Samples with a scale factor which is not
+            positive (e.g. of corrupted frames) are converted to NaN.
+        :param array-like temperature_ticks:
+            The temperature ticks. Only required if the flow element has a
+            temperature correction.
+        :param array-like valid:
+            Optional validity mask of the samples, e.g. the CRC validity of
+            decoded frames. Invalid samples are converted to NaN.
+        :return: The flow of every sample.
+        :rtype: numpy.ndarray
+        :raise ValueError:
+            If a single scale factor is given which is not positive, or if
+            the flow element has a temperature correction, but no temperature
+            ticks are given.
+        """
+        if self._uses_temperature and temperature_ticks is None:
+            raise ValueError("The flow element has a temperature correction, thus temperature ticks are required.")
+        indices = np.asarray(differential_pressure_ticks).astype(np.int16, copy=False).view(np.uint16)
+        scale_factors = np.asarray(scale_factor)
+        if scale_factors.ndim == 0:
+            flow = _get_pressure_table(self._element, int(scale_factors)).take(indices)
+            if valid is not None:
+                flow[~np.asarray(valid, dtype=bool)] = np.nan
+        else:
+            convertible = scale_factors > 0
+            if valid is not None:
+                convertible &= np.asarray(valid, dtype=bool)
+            flow = np.full(indices.shape, np.nan)
+            for value in np.unique(scale_factors[convertible]):
+                mask = convertible & (scale_factors == value)
+                flow[mask] = _get_pressure_table(self._element, int(value)).take(indices[mask])
+        flow *= self._element.gain
+        if self._uses_temperature:
+            temperature_indices = np.asarray(temperature_ticks).astype(np.int16, copy=False).view(np.uint16)
+            flow *= _get_temperature_table(self._element).take(temperature_indices)
+        return flow
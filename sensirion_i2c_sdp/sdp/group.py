@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+from sensirion_i2c_driver.errors import I2cError
+
+
+class SdpI2cDeviceGroup(object):
+    """
+    Group of SDP devices measured together in triggered mode.
+
+    Instead of waiting the 45ms measurement time of every sensor one after
+    the other, the measurements of all sensors are triggered back to back
+    and the results are read once the sensors are done. Thus measuring the
+    whole group takes about as long as measuring a single sensor.
+
+    The devices may be located on the same connection (with different slave
+    addresses) or on different connections, e.g. different SensorBridge
+    ports.
+
+    Like a multi-channel :py:class:`~sensirion_i2c_driver.connection.I2cConnection`,
+    the methods return one entry per device, containing either the result or
+    the exception raised for that device. Thus a failing sensor does not
+    prevent reading the others.
+
+    .. sourcecode:: python
+
+        group = SdpI2cDeviceGroup([SdpI2cDevice(connection, address) for address in (0x21, 0x22, 0x23)])
+        for result in group.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging():
+            if not isinstance(result, Exception):
+                differential_pressure, temperature = result
+    """
+
+    def __init__(self, devices):
+        """
+        Creates a group of devices.
+
+        :param list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice) devices:
+            The devices of the group.
+        """
+        super(SdpI2cDeviceGroup, self).__init__()
+        self._devices = list(devices)
+
+    @property
+    def devices(self):
+        """
+        Get the devices of this group.
+
+        :rtype: list(~sensirion_i2c_sdp.sdp.device.SdpI2cDevice)
+        """
+        return self._devices
+
+    def trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with mass flow temperature
+        compensation on all devices and read their results.
+
+        :return:
+            For every device either a tuple of the differential pressure and
+            temperature response objects, or the raised exception.
+        :rtype: list
+        """
+        return self._trigger_and_read('trigger_measurement_with_mass_flow_t_comp_and_averaging')
+
+    def trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging(self):
+        """
+        Trigger a single shot measurement with differential pressure
+        temperature compensation on all devices and read their results.
+
+        :return:
+            For every device either a tuple of the differential pressure and
+            temperature response objects, or the raised exception.
+        :rtype: list
+        """
+        return self._trigger_and_read('trigger_measurement_with_diff_pressure_t_comp_and_averaging')
+
+    def read_measurement(self):
+        """
+        Read the measurement results of all devices, e.g. during a continuous
+        measurement.
+
+        :return:
+            For every device either a tuple of the differential pressure and
+            temperature response objects, or the raised exception.
+        :rtype: list
+        """
+        results = []
+        for device in self._devices:
+            try:
+                results.append(device.read_measurement())
+            except I2cError as e:
+                results.append(e)
+        return results
+
+    def _trigger_and_read(self, trigger_measurement):
+        results = [None] * len(self._devices)
+        # Triggering doesn't block, every device only waits for its own
+        # measurement to complete when its result is read.
+        for i, device in enumerate(self._devices):
+            try:
+                getattr(device, trigger_measurement)()
+            except I2cError as e:
+                results[i] = e
+        for i, device in enumerate(self._devices):
+            if results[i] is None:
+                try:
+                    results[i] = device.read_measurement()
+                except I2cError as e:
+                    results[i] = e
+        return results
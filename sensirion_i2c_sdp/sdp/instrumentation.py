@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Opt-in instrumentation of :py:class:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice`.
+
+Assign an observer to :py:attr:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.observer`
+to get notified about every executed command. :py:class:`SdpStatistics`
+is an observer which collects counters and latency histograms:
+
+.. sourcecode:: python
+
+    statistics = SdpStatistics()
+    sdp.observer = statistics
+    ...
+    print(statistics.snapshot())
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import time
+from bisect import bisect_left
+
+from sensirion_i2c_driver.errors import I2cChecksumError, I2cNackError
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdReadMeasurement
+from sensirion_i2c_sdp.sdp.extended_commands import SdpI2cCmdReadDifferentialPressure, \
+    SdpI2cCmdTriggerAndReadMeasurement
+
+# Commands which return a measurement sample
+_MEASUREMENT_COMMANDS = (SdpI2cCmdReadMeasurement, SdpI2cCmdReadDifferentialPressure,
+                         SdpI2cCmdTriggerAndReadMeasurement)
+
+
+class SdpObserver(object):
+    """
+    Base class for observers of executed commands. Derived classes override
+    :py:meth:`on_command`.
+    """
+
+    def on_command(self, device, command, bus_time, read_delay, wait_time, error):
+        """
+        Called after a command has been executed.
+
+        :param ~sensirion_i2c_sdp.sdp.device.SdpI2cDevice device:
+            The device which executed the command.
+        :param ~sensirion_i2c_driver.command.I2cCommand command:
+            The executed command.
+        :param float bus_time:
+            Time in seconds the transfer took, without the read delay.
+        :param float read_delay:
+            Read delay in seconds inserted into the transfer.
+        :param float wait_time:
+            Time in seconds spent waiting before the command for the device
+            to finish post processing of the previous command.
+        :param Exception/None error:
+            The exception raised by the command, or None on success.
+        """
+        pass
+
+
+class SdpHistogram(object):
+    """
+    Histogram of durations with logarithmic buckets from 10µs to about 1.3s.
+    """
+
+    #: Upper bounds (in seconds) of the buckets. Longer durations are counted
+    #: in an additional overflow bucket.
+    BUCKET_BOUNDS = tuple(1e-5 * 2 ** i for i in range(18))
+
+    def __init__(self):
+        super(SdpHistogram, self).__init__()
+        self.counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        """
+        Add a duration to the histogram.
+
+        :param float value: The duration in seconds.
+        """
+        self.counts[bisect_left(self.BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def to_dict(self):
+        """
+        Get the histogram as dict.
+
+        :rtype: dict
+        """
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.total / self.count if self.count else None,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            bucket_bounds=list(self.BUCKET_BOUNDS),
+            bucket_counts=list(self.counts),
+        )
+
+
+class SdpStatistics(SdpObserver):
+    """
+    Observer collecting command counters, latency histograms, error counters
+    and the achieved sample rate. It may be shared by several devices.
+    """
+
+    def __init__(self):
+        super(SdpStatistics, self).__init__()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all statistics.
+        """
+        with self._lock:
+            self._command_counts = {}
+            self._bus_time = SdpHistogram()
+            self._read_delay = SdpHistogram()
+            self._wait_time = SdpHistogram()
+            self._crc_error_count = 0
+            self._nack_count = 0
+            self._other_error_count = 0
+            self._sample_count = 0
+            self._first_sample_time = None
+            self._last_sample_time = None
+
+    def on_command(self, device, command, bus_time, read_delay, wait_time, error):
+        now = time.monotonic()
+        name = type(command).__name__
+        with self._lock:
+            self._command_counts[name] = self._command_counts.get(name, 0) + 1
+            self._bus_time.add(bus_time)
+            self._read_delay.add(read_delay)
+            self._wait_time.add(wait_time)
+            if error is None:
+                if isinstance(command, _MEASUREMENT_COMMANDS):
+                    self._sample_count += 1
+                    if self._first_sample_time is None:
+                        self._first_sample_time = now
+                    self._last_sample_time = now
+            elif isinstance(error, I2cChecksumError):
+                self._crc_error_count += 1
+            elif isinstance(error, I2cNackError):
+                self._nack_count += 1
+            else:
+                self._other_error_count += 1
+
+    def snapshot(self):
+        """
+        Get a snapshot of the collected statistics.
+
+        :return:
+            A dict with the number of executions per command class name
+            (``commands``), histograms of ``bus_time``, ``read_delay`` and
+            ``wait_time`` (see :py:meth:`SdpHistogram.to_dict`), the error
+            counters ``crc_errors``, ``nacks`` and ``other_errors``, the
+            number of successfully read ``samples`` and the achieved
+            ``sample_rate`` in Hz (None if less than two samples were read).
+        :rtype: dict
+        """
+        with self._lock:
+            sample_rate = None
+            if self._sample_count > 1 and self._last_sample_time > self._first_sample_time:
+                sample_rate = (self._sample_count - 1) / (self._last_sample_time - self._first_sample_time)
+            return dict(
+                commands=dict(self._command_counts),
+                bus_time=self._bus_time.to_dict(),
+                read_delay=self._read_delay.to_dict(),
+                wait_time=self._wait_time.to_dict(),
+                crc_errors=self._crc_error_count,
+                nacks=self._nack_count,
+                other_errors=self._other_error_count,
+                samples=self._sample_count,
+                sample_rate=sample_rate,
+            )
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Registry of the known SDP products and their capabilities, looked up by
+the product number returned by
+:py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_product_identifier`.
+
+.. sourcecode:: python
+
+    product_number, serial_number = sdp.read_product_identifier()
+    product = get_product(product_number)
+    print(product.name, product.scale_factor)
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from collections import namedtuple
+
+from sensirion_i2c_sdp.sdp.data_types import SdpProductFamily
+
+# The last byte of the product number is the revision of the sensor
+_REVISION_MASK = 0xFFFFFF00
+
+_SDP3X_ADDRESSES = (0x21, 0x22, 0x23)
+_SDP8XX_ADDRESSES = (0x25, 0x26)
+
+#: Capabilities of an SDP product.
+#:
+#: - ``product_number``: The product number without the revision byte.
+#: - ``name``: The product name, e.g. ``"SDP810-500Pa"``.
+#: - ``family``: The :py:class:`~sensirion_i2c_sdp.sdp.data_types.SdpProductFamily`.
+#: - ``range``: The specified measurement range in Pa (symmetric around zero).
+#: - ``scale_factor``: The fixed differential pressure scale factor in 1/Pa.
+#: - ``slave_addresses``: The I²C addresses the product supports.
+SdpProduct = namedtuple('SdpProduct', [
+    'product_number',
+    'name',
+    'family',
+    'range',
+    'scale_factor',
+    'slave_addresses',
+])
+
+_products = {}
+
+
+def register_product(product):
+    """
+    Add a product to the registry, or replace the registered product with
+    the same product number.
+
+    :param SdpProduct product: The product to register.
+    """
+    _products[product.product_number & _REVISION_MASK] = product
+
+
+def get_product(product_number):
+    """
+    Look up a product by its product number.
+
+    :param int product_number:
+        The product number as returned by the sensor, the revision byte is
+        ignored.
+    :return: The product, or None if the product number is unknown.
+    :rtype: SdpProduct/None
+    """
+    return _products.get(product_number & _REVISION_MASK)
+
+
+def get_products():
+    """
+    Get all registered products.
+
+    :rtype: list(SdpProduct)
+    """
+    return list(_products.values())
+
+
+for _product in (
+    SdpProduct(0x03010100, "SDP31", SdpProductFamily.SDP3X, 500, 60, _SDP3X_ADDRESSES),
+    SdpProduct(0x03010200, "SDP32", SdpProductFamily.SDP3X, 125, 240, _SDP3X_ADDRESSES),
+    SdpProduct(0x03010300, "SDP33", SdpProductFamily.SDP3X, 1500, 20, _SDP3X_ADDRESSES),
+    SdpProduct(0x03020100, "SDP800-500Pa", SdpProductFamily.SDP8XX, 500, 60, _SDP8XX_ADDRESSES),
+    SdpProduct(0x03020200, "SDP800-125Pa", SdpProductFamily.SDP8XX, 125, 240, _SDP8XX_ADDRESSES),
+    SdpProduct(0x03020400, "SDP801-500Pa", SdpProductFamily.SDP8XX, 500, 60, _SDP8XX_ADDRESSES),
+    SdpProduct(0x03020A00, "SDP810-500Pa", SdpProductFamily.SDP8XX, 500, 60, _SDP8XX_ADDRESSES),
+    SdpProduct(0x03020B00, "SDP810-125Pa", SdpProductFamily.SDP8XX, 125, 240, _SDP8XX_ADDRESSES),
+    SdpProduct(0x03020D00, "SDP811-500Pa", SdpProductFamily.SDP8XX, 500, 60, _SDP8XX_ADDRESSES),
+):
+    register_product(_product)
+del _product
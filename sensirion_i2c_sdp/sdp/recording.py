@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Compact binary recording of raw measurement results.
+
+A recording consists of an append-only data file and an index file (same
+path with ``.idx`` appended). The data file is a sequence of chunks, each
+holding up to a few thousand samples of a single scale factor:
+
+- a 24 byte header: magic ``SDPC``, number of samples (uint32), scale
+  factor (int16), 6 reserved bytes, timestamp of the first sample (float64)
+- the timestamp deltas to the previous sample in µs (uint32 each, the first
+  one is zero)
+- the differential pressure ticks (int16 each)
+- the temperature ticks (int16 each)
+
+All values are little endian. A sample thus takes 8 bytes. The index file
+contains one 32 byte entry per chunk (offset, number of samples, scale
+factor, first and last timestamp) for random access.
+
+.. sourcecode:: python
+
+    with SdpRecordingWriter("flow.sdprec") as writer, sdp.stream(rate=1000.0) as stream:
+        while True:
+            writer.write_samples(stream.read())
+            time.sleep(0.1)
+
+    with SdpRecordingReader("flow.sdprec") as reader:
+        data = reader.read(start=t0, end=t0 + 60.0)
+        pascal = data.differential_pressure_ticks / data.scale_factor
+
+The reader requires NumPy, which can be installed with
+``pip install sensirion-i2c-sdp[numpy]``.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_MAGIC = b"SDPC"
+_CHUNK_HEADER = struct.Struct("<4sIh6xd")
+_INDEX_ENTRY = struct.Struct("<QIh2xdd")
+
+# Resolution of the timestamp deltas in seconds
+_DELTA_RESOLUTION = 1e-6
+_MAX_DELTA = 0xFFFFFFFF
+
+# Array type code of uint32 (platform dependent)
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+
+#: A chunk of a recording, as stored in the index.
+SdpRecordingChunk = namedtuple('SdpRecordingChunk', [
+    'offset',
+    'sample_count',
+    'scale_factor',
+    'first_timestamp',
+    'last_timestamp',
+])
+
+#: Samples read from a recording. All fields except ``scale_factor`` are
+#: NumPy arrays. If the samples originate from several chunks with
+#: different scale factors, ``scale_factor`` is an array as well.
+SdpRecordingData = namedtuple('SdpRecordingData', [
+    'timestamps',
+    'differential_pressure_ticks',
+    'temperature_ticks',
+    'scale_factor',
+])
+
+
+class SdpRecordingWriter(object):
+    """
+    Writes samples to a recording. Samples are buffered and written as a
+    chunk when the chunk is full, the scale factor changes or the writer is
+    flushed or closed. If the file already exists, the samples are appended.
+    """
+
+    def __init__(self, path, chunk_size=4096):
+        """
+        Opens a recording for writing.
+
+        :param str path: Path of the data file.
+        :param int chunk_size: Maximum number of samples per chunk.
+        """
+        super(SdpRecordingWriter, self).__init__()
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        self._chunk_size = chunk_size
+        self._data_file = open(path, 'ab')
+        self._index_file = open(path + '.idx', 'ab')
+        self._offset = self._data_file.seek(0, os.SEEK_END)
+        self._reset_chunk(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, timestamp, differential_pressure_ticks, temperature_ticks, scale_factor):
+        """
+        Write a single sample.
+
+        :param float timestamp: The timestamp in seconds.
+        :param int differential_pressure_ticks: The differential pressure ticks.
+        :param int temperature_ticks: The temperature ticks.
+        :param int scale_factor: The differential pressure scale factor.
+        """
+        if self._count and (scale_factor != self._scale_factor or self._count >= self._chunk_size):
+            self.flush()
+        if self._count == 0:
+            self._scale_factor = scale_factor
+            self._first_timestamp = self._last_timestamp = timestamp
+            delta = 0
+        else:
+            delta = int(round((timestamp - self._last_timestamp) / _DELTA_RESOLUTION))
+            if not 0 <= delta <= _MAX_DELTA:
+                # Not representable, e.g. after a long pause
+                self.flush()
+                self.write(timestamp, differential_pressure_ticks, temperature_ticks, scale_factor)
+                return
+            # Accumulate the stored (rounded) deltas to avoid drift
+            self._last_timestamp += delta * _DELTA_RESOLUTION
+        self._deltas.append(delta)
+        self._differential_pressure_ticks.append(differential_pressure_ticks)
+        self._temperature_ticks.append(temperature_ticks)
+        self._count += 1
+
+    def write_samples(self, samples):
+        """
+        Write several samples, e.g. as read from
+        :py:class:`~sensirion_i2c_sdp.sdp.stream.SdpStream`.
+
+        :param iterable samples:
+            The samples, with the attributes ``timestamp``,
+            ``differential_pressure_ticks``, ``temperature_ticks`` and
+            ``scale_factor``.
+        """
+        for sample in samples:
+            self.write(sample.timestamp, sample.differential_pressure_ticks, sample.temperature_ticks,
+                       sample.scale_factor)
+
+    def flush(self):
+        """
+        Write the buffered samples as a chunk and flush the files.
+        """
+        if self._count:
+            header = _CHUNK_HEADER.pack(_MAGIC, self._count, self._scale_factor, self._first_timestamp)
+            arrays = (self._deltas, self._differential_pressure_ticks, self._temperature_ticks)
+            if sys.byteorder == 'big':  # pragma: no cover
+                for values in arrays:
+                    values.byteswap()
+            self._data_file.write(header + b"".join(values.tobytes() for values in arrays))
+            self._index_file.write(_INDEX_ENTRY.pack(self._offset, self._count, self._scale_factor,
+                                                     self._first_timestamp, self._last_timestamp))
+            self._offset += _CHUNK_HEADER.size + 8 * self._count
+            self._reset_chunk(self._scale_factor)
+        self._data_file.flush()
+        self._index_file.flush()
+
+    def close(self):
+        """
+        Write the buffered samples and close the files.
+        """
+        if not self._data_file.closed:
+            self.flush()
+            self._data_file.close()
+            self._index_file.close()
+
+    def _reset_chunk(self, scale_factor):
+        self._count = 0
+        self._scale_factor = scale_factor
+        self._first_timestamp = None
+        self._last_timestamp = None
+        self._deltas = array(_UINT32)
+        self._differential_pressure_ticks = array('h')
+        self._temperature_ticks = array('h')
+
+
+class SdpRecordingReader(object):
+    """
+    Reads a recording through a memory map. The ticks of a single chunk are
+    returned as NumPy arrays referencing the memory map, i.e. without
+    copying them.
+
+    Chunks which are missing in the index (e.g. because the writing process
+    crashed) are recovered from their chunk headers, also if further chunks
+    were appended afterwards. Chunks which were not completely written are
+    ignored.
+
+    The timestamps of a recording are not necessarily monotonic, e.g. if a
+    session with a reset clock has been appended. The samples are always
+    returned in the order they were recorded.
+    """
+
+    def __init__(self, path):
+        """
+        Opens a recording for reading.
+
+        :param str path: Path of the data file.
+        :raise ImportError: If NumPy is not installed.
+        """
+        super(SdpRecordingReader, self).__init__()
+        if np is None:
+            raise ImportError("NumPy is required to read recordings.")
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._chunks = self._load_index(path + '.idx', size)
+        self._first_timestamps = [chunk.first_timestamp for chunk in self._chunks]
+        self._last_timestamps = [chunk.last_timestamp for chunk in self._chunks]
+        self._ordered = all(a.last_timestamp <= b.first_timestamp for a, b in zip(self._chunks, self._chunks[1:]))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return sum(chunk.sample_count for chunk in self._chunks)
+
+    @property
+    def chunks(self):
+        """
+        The chunks of the recording.
+
+        :type: list(SdpRecordingChunk)
+        """
+        return list(self._chunks)
+
+    def read_chunk(self, index):
+        """
+        Read the samples of a single chunk. The ticks are not copied.
+
+        :param int index: The index of the chunk.
+        :rtype: SdpRecordingData
+        """
+        chunk = self._chunks[index]
+        count = chunk.sample_count
+        offset = chunk.offset + _CHUNK_HEADER.size
+        deltas = np.frombuffer(self._mmap, dtype='<u4', count=count, offset=offset)
+        timestamps = chunk.first_timestamp + np.cumsum(deltas, dtype=np.float64) * _DELTA_RESOLUTION
+        differential_pressure_ticks = np.frombuffer(self._mmap, dtype='<i2', count=count, offset=offset + 4 * count)
+        temperature_ticks = np.frombuffer(self._mmap, dtype='<i2', count=count, offset=offset + 6 * count)
+        return SdpRecordingData(timestamps, differential_pressure_ticks, temperature_ticks, chunk.scale_factor)
+
+    def read(self, start=None, end=None):
+        """
+        Read the samples within a time range.
+
+        :param float/None start:
+            Timestamp of the first sample to read, or None to start at the
+            beginning of the recording.
+        :param float/None end:
+            Timestamp after the last sample to read, or None to read until
+            the end of the recording.
+        :rtype: SdpRecordingData
+        """
+        if self._ordered:
+            first = 0 if start is None else bisect_left(self._last_timestamps, start)
+            last = len(self._chunks) if end is None else bisect_left(self._first_timestamps, end)
+            indices = range(first, last)
+        else:
+            # The chunks are not sorted by time, thus check all of them
+            indices = [index for index, chunk in enumerate(self._chunks)
+                       if (start is None or chunk.last_timestamp >= start) and
+                       (end is None or chunk.first_timestamp < end)]
+        parts = []
+        for index in indices:
+            data = self.read_chunk(index)
+            begin = 0 if start is None else np.searchsorted(data.timestamps, start, 'left')
+            stop = len(data.timestamps) if end is None else np.searchsorted(data.timestamps, end, 'left')
+            parts.append(SdpRecordingData(*[values[begin:stop] for values in data[:3]],
+                                          scale_factor=data.scale_factor))
+        if not parts:
+            return SdpRecordingData(np.zeros(0), np.zeros(0, '<i2'), np.zeros(0, '<i2'), None)
+        if len(parts) == 1:
+            return parts[0]
+        scale_factors = set(part.scale_factor for part in parts)
+        if len(scale_factors) == 1:
+            scale_factor = scale_factors.pop()
+        else:
+            scale_factor = np.concatenate([np.full(len(part.timestamps), part.scale_factor, dtype=np.int16)
+                                           for part in parts])
+        return SdpRecordingData(
+            np.concatenate([part.timestamps for part in parts]),
+            np.concatenate([part.differential_pressure_ticks for part in parts]),
+            np.concatenate([part.temperature_ticks for part in parts]),
+            scale_factor,
+        )
+
+    def close(self):
+        """
+        Close the recording. If arrays returned by the reader still reference
+        the memory map, it is unmapped once they are released.
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+        self._file.close()
+
+    def _load_index(self, index_path, size):
+        indexed_chunks = []
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as f:
+                data = f.read()
+            for i in range(len(data) // _INDEX_ENTRY.size):
+                chunk = SdpRecordingChunk(*_INDEX_ENTRY.unpack_from(data, i * _INDEX_ENTRY.size))
+                if chunk.offset + _CHUNK_HEADER.size + 8 * chunk.sample_count > size:
+                    break
+                indexed_chunks.append(chunk)
+        # Recover chunks which are missing in the index, i.e. in the gaps
+        # between the indexed chunks and after the last indexed chunk
+        chunks = []
+        offset = 0
+        for chunk in indexed_chunks:
+            if chunk.offset > offset:
+                chunks.extend(self._scan_chunks(offset, chunk.offset))
+            chunks.append(chunk)
+            offset = max(offset, chunk.offset + _CHUNK_HEADER.size + 8 * chunk.sample_count)
+        chunks.extend(self._scan_chunks(offset, size))
+        return chunks
+
+    def _scan_chunks(self, offset, stop):
+        chunks = []
+        while offset + _CHUNK_HEADER.size <= stop:
+            magic, count, scale_factor, first_timestamp = _CHUNK_HEADER.unpack_from(self._mmap, offset)
+            end = offset + _CHUNK_HEADER.size + 8 * count
+            if magic != _MAGIC or count == 0 or end > stop:
+                # Not a complete chunk (e.g. written partially before a
+                # crash), continue with the next chunk header if there is any
+                offset = self._mmap.find(_MAGIC, offset + 1, stop)
+                if offset < 0:
+                    break
+                continue
+            deltas = np.frombuffer(self._mmap, dtype='<u4', count=count, offset=offset + _CHUNK_HEADER.size)
+            last_timestamp = first_timestamp + float(deltas.sum(dtype=np.float64)) * _DELTA_RESOLUTION
+            chunks.append(SdpRecordingChunk(offset, count, scale_factor, first_timestamp, last_timestamp))
+            offset = end
+        return chunks
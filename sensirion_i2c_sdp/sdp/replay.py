@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Capturing and replaying of the raw I²C traffic of a session, e.g. to profile
+the driver and downstream processing with production data without
+hardware.
+
+.. sourcecode:: python
+
+    # Capture the traffic of a real session
+    with open("session.jsonl", "w") as f:
+        sdp = SdpI2cDevice(I2cConnection(SdpCapturingI2cTransceiver(i2c_transceiver, f)))
+        ...
+
+    # Replay it deterministically
+    with open("session.jsonl") as f:
+        transceiver = SdpReplayI2cTransceiver(load_traffic(f))
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    ...
+
+The traffic is stored as JSON lines, one per transfer, with the data as hex
+strings.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import binascii
+import json
+import time
+from collections import namedtuple
+
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+
+#: A captured I²C transfer. ``time`` is the start of the transfer relative to
+#: the start of the first transfer, ``duration`` its duration (both in
+#: seconds). ``error`` is the message of the error returned by the
+#: transceiver, or None.
+SdpI2cFrame = namedtuple('SdpI2cFrame', [
+    'time',
+    'duration',
+    'slave_address',
+    'tx_data',
+    'rx_length',
+    'read_delay',
+    'timeout',
+    'status',
+    'error',
+    'rx_data',
+])
+
+
+class SdpReplayError(Exception):
+    """
+    Raised if the replayed traffic does not match the executed commands, or
+    if the end of the traffic is reached.
+    """
+    pass
+
+
+def _to_hex(data):
+    return None if data is None else binascii.hexlify(data).decode('ascii')
+
+
+def _from_hex(text):
+    return None if text is None else binascii.unhexlify(text)
+
+
+def load_traffic(file):
+    """
+    Load captured traffic.
+
+    :param file: Text file object to read the JSON lines from.
+    :return: The captured transfers.
+    :rtype: list(SdpI2cFrame)
+    """
+    frames = []
+    for line in file:
+        if line.strip():
+            frame = json.loads(line)
+            frames.append(SdpI2cFrame(
+                frame['time'], frame['duration'], frame['slave_address'], _from_hex(frame['tx_data']),
+                frame['rx_length'], frame['read_delay'], frame['timeout'], frame['status'], frame['error'],
+                _from_hex(frame['rx_data'])))
+    return frames
+
+
+class SdpCapturingI2cTransceiver(I2cTransceiverV1):
+    """
+    Single channel I²C transceiver which forwards all transfers to another
+    transceiver and writes them to a file, see :py:func:`load_traffic`.
+    """
+
+    def __init__(self, transceiver, file):
+        """
+        Creates a capturing transceiver.
+
+        :param transceiver: The (single channel, API version 1) transceiver
+            to forward the transfers to.
+        :param file: Text file object to write the JSON lines to.
+        """
+        super(SdpCapturingI2cTransceiver, self).__init__()
+        self._transceiver = transceiver
+        self._file = file
+        self._start_time = None
+
+    @property
+    def description(self):
+        return "Capturing {}".format(self._transceiver.description)
+
+    @property
+    def channel_count(self):
+        return None
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay, timeout):
+        """
+        Transceive an I²C frame with the underlying transceiver and capture
+        it. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """
+        start = time.monotonic()
+        if self._start_time is None:
+            self._start_time = start
+        status, error, rx_data = self._transceiver.transceive(slave_address, tx_data, rx_length, read_delay,
+                                                              timeout)
+        frame = dict(
+            time=start - self._start_time,
+            duration=time.monotonic() - start,
+            slave_address=slave_address,
+            tx_data=_to_hex(tx_data),
+            rx_length=rx_length,
+            read_delay=read_delay,
+            timeout=timeout,
+            status=status,
+            error=None if error is None else str(error),
+            rx_data=_to_hex(rx_data),
+        )
+        self._file.write(json.dumps(frame, sort_keys=True) + "\n")
+        return status, error, rx_data
+
+
+class SdpReplayI2cTransceiver(I2cTransceiverV1):
+    """
+    Single channel I²C transceiver which answers transfers with captured
+    traffic, see :py:func:`load_traffic`.
+
+    By default, the transfers are answered immediately. With
+    ``realtime=True`` the original pace is reproduced, i.e. every transfer
+    is answered not before its captured start time (relative to the first
+    replayed transfer) plus its captured duration. Note that
+    :py:class:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice` still waits for
+    post processing times of commands in either case.
+    """
+
+    def __init__(self, frames, realtime=False, strict=True, loop=False):
+        """
+        Creates a replaying transceiver.
+
+        :param list(SdpI2cFrame) frames: The captured transfers.
+        :param bool realtime: Whether to reproduce the original pace.
+        :param bool strict:
+            If True, every transfer must match the captured one (slave
+            address, sent data and read length), otherwise
+            :py:class:`SdpReplayError` is raised.
+        :param bool loop:
+            If True, the traffic is replayed again from the beginning after
+            the last transfer, otherwise :py:class:`SdpReplayError` is
+            raised.
+        """
+        super(SdpReplayI2cTransceiver, self).__init__()
+        self._frames = list(frames)
+        self._realtime = realtime
+        self._strict = strict
+        self._loop = loop
+        self._position = 0
+        self._start_time = None
+
+    @property
+    def description(self):
+        return "Replay of {} I2C transfers".format(len(self._frames))
+
+    @property
+    def channel_count(self):
+        return None
+
+    @property
+    def position(self):
+        """
+        Index of the next transfer to replay.
+
+        :type: int
+        """
+        return self._position
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay, timeout):
+        """
+        Answer an I²C frame with the next captured transfer. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """
+        if self._position >= len(self._frames):
+            if not (self._loop and self._frames):
+                raise SdpReplayError("End of the replayed traffic reached.")
+            self._position = 0
+            self._start_time = None
+        frame = self._frames[self._position]
+        if self._strict and (slave_address, tx_data, rx_length) != \
+                (frame.slave_address, frame.tx_data, frame.rx_length):
+            raise SdpReplayError("Transfer {} does not match: expected {}, got {}".format(
+                self._position, (frame.slave_address, frame.tx_data, frame.rx_length),
+                (slave_address, tx_data, rx_length)))
+        self._position += 1
+        if self._realtime:
+            now = time.monotonic()
+            if self._start_time is None:
+                self._start_time = now - frame.time
+            delay = self._start_time + frame.time + frame.duration - now
+            if delay > 0.0:
+                time.sleep(delay)
+        error = None if frame.error is None else Exception(frame.error)
+        return frame.status, error, frame.rx_data
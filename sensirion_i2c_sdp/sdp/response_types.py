@@ -10,12 +10,15 @@ class SdpTemperature(object):
 
     With the :py:attr:`ticks` you can access the raw data as received from the
     device. For the converted values you can choose between
-    :py:attr:`degrees_celsius` and :py:attr:`degrees_fahrenheit`.
+    :py:attr:`degrees_celsius` and :py:attr:`degrees_fahrenheit`, which are
+    calculated on access.
 
     :param int ticks:
         The read ticks as received from the device.
     """
 
+    __slots__ = ('ticks',)
+
     def __init__(self, ticks):
         """
         Creates an instance from the received raw data.
@@ -24,11 +27,19 @@ class SdpTemperature(object):
         #: The ticks (int) as received from the device.
         self.ticks = ticks
 
-        #: The converted temperature in °C.
-        self.degrees_celsius = float(ticks) / 200.
+    @property
+    def degrees_celsius(self):
+        """
+        The converted temperature in °C (float).
+        """
+        return float(self.ticks) / 200.
 
-        #: The converted temperature in °F.
-        self.degrees_fahrenheit = (ticks * 9. / 1000.) + 32
+    @property
+    def degrees_fahrenheit(self):
+        """
+        The converted temperature in °F (float).
+        """
+        return (self.ticks * 9. / 1000.) + 32
 
     def __str__(self):
         return '{:0.1f} °C'.format(self.degrees_celsius)
@@ -40,7 +51,7 @@ class SdpDifferentialPressure(object):
 
     With the :py:attr:`ticks` you can access the raw data as received from the
     device. For the converted value the :py:attr:`pascal` attribute is
-    available.
+    available, which is calculated on access.
 
     :param int ticks:
         The read ticks as received from the device.
@@ -49,6 +60,8 @@ class SdpDifferentialPressure(object):
         ticks as received from the sensor into Pascal.
     """
 
+    __slots__ = ('ticks', 'scale_factor')
+
     def __init__(self, ticks, scale_factor):
         """
         Creates an instance from the received raw data.
@@ -60,8 +73,12 @@ class SdpDifferentialPressure(object):
         #: The scale factor (int) as received from the device.
         self.scale_factor = scale_factor
 
-        #: The converted concentration in vol%.
-        self.pascal = float(self.ticks) / float(self.scale_factor)
+    @property
+    def pascal(self):
+        """
+        The converted differential pressure in Pa (float).
+        """
+        return float(self.ticks) / float(self.scale_factor)
 
     def __str__(self):
         return '{:0.2f} Pa'.format(self.pascal)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+"""
+Simulated SDP sensors behind an I²C transceiver, which allows to run the
+driver without any hardware, e.g. for tests and benchmarks.
+
+.. sourcecode:: python
+
+    transceiver = SdpSimulatedI2cTransceiver({
+        0x21: SdpSimulatedSensor(differential_pressure=12.5, noise=0.1),
+        0x25: SdpSimulatedSensor(),
+    })
+    sdp = SdpI2cDevice(I2cConnection(transceiver), slave_address=0x21)
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import random
+import time
+from struct import pack
+
+from sensirion_i2c_driver.transceiver_v1 import I2cTransceiverV1
+
+from sensirion_i2c_sdp.sdp.crc import calculate_crc
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+
+_START_CONTINUOUS_COMMANDS = (0x3603, 0x3608, 0x3615, 0x361E)
+_TRIGGER_COMMANDS = (0x3624, 0x362F)
+_STOP_COMMAND = 0x3FF9
+_ENTER_SLEEP_COMMAND = 0x3677
+_EXIT_SLEEP_COMMAND = 0x0002
+_PREPARE_PRODUCT_IDENTIFIER_COMMAND = 0x367C
+_READ_PRODUCT_IDENTIFIER_COMMAND = 0xE102
+
+#: Time after starting a continuous measurement until the first result is available.
+FIRST_RESULT_DELAY = 0.008
+
+#: Interval at which the results of a continuous measurement are updated.
+UPDATE_INTERVAL = 0.0005
+
+#: Time a triggered measurement takes.
+TRIGGERED_MEASUREMENT_TIME = 0.045
+
+#: Time after waking up from sleep mode until commands are acknowledged.
+WAKE_UP_TIME = 0.002
+
+
+def _add_crc(data):
+    result = bytearray()
+    for i in range(0, len(data), 2):
+        word = bytearray(data[i:i + 2])
+        result += word
+        result.append(calculate_crc(word))
+    return bytes(result)
+
+
+class SdpSimulatedSensor(object):
+    """
+    A simulated SDP sensor.
+
+    The sensor only acknowledges commands which are allowed in its current
+    mode, e.g. while a triggered measurement is running or while sleeping,
+    every command is answered with a NACK. Like the real sensor, any write
+    header wakes it up from sleep mode even though it is not acknowledged,
+    and further commands are acknowledged after :py:data:`WAKE_UP_TIME`.
+    During a continuous measurement the result is updated every
+    :py:data:`UPDATE_INTERVAL`, i.e. reading faster returns the same result
+    several times.
+    """
+
+    def __init__(self, product_number=0x03020A01, serial_number=0x0123456789ABCDEF, scale_factor=60,
+                 differential_pressure=0.0, temperature=25.0, noise=0.0, seed=None):
+        """
+        Creates a simulated sensor.
+
+        :param int product_number:
+            The product number returned by the product identifier command.
+        :param int serial_number:
+            The serial number returned by the product identifier command.
+        :param int scale_factor:
+            The scale factor of the differential pressure.
+        :param float differential_pressure:
+            The measured differential pressure in Pa.
+        :param float temperature:
+            The measured temperature in °C.
+        :param float noise:
+            Standard deviation in Pa of a gaussian noise added to every
+            differential pressure measurement.
+        :param seed:
+            Seed of the noise generator, to get reproducible measurements.
+        """
+        super(SdpSimulatedSensor, self).__init__()
+        self.product_number = product_number
+        self.serial_number = serial_number
+        self.scale_factor = scale_factor
+        self.differential_pressure = differential_pressure
+        self.temperature = temperature
+        self.noise = noise
+        self._random = random.Random(seed)
+        self._mode = SdpMeasurementMode.IDLE
+        self._measurement_ready_at = 0.0
+        self._measurement_available = False
+        self._awake_at = 0.0
+        self._result = None
+        self._result_index = None
+        self._product_identifier_prepared = False
+        self._read_product_identifier = False
+
+    @property
+    def mode(self):
+        """
+        The current mode of the sensor.
+
+        :type: ~sensirion_i2c_sdp.sdp.data_types.SdpMeasurementMode
+        """
+        return self._mode
+
+    def write(self, data, now):
+        """
+        Process a write operation.
+
+        :param bytes data: The written data.
+        :param float now: The current time.
+        :return: Whether the write operation was acknowledged.
+        :rtype: bool
+        """
+        if self._mode is SdpMeasurementMode.SLEEP:
+            self._mode = SdpMeasurementMode.IDLE
+            self._awake_at = now + WAKE_UP_TIME
+            return False
+        if (now < self._awake_at) or (len(data) != 2):
+            return False
+        command = (bytearray(data)[0] << 8) | bytearray(data)[1]
+        busy = (self._mode is SdpMeasurementMode.TRIGGERED) and (now < self._measurement_ready_at)
+        idle = (self._mode is SdpMeasurementMode.IDLE) or \
+            ((self._mode is SdpMeasurementMode.TRIGGERED) and not busy)
+        self._read_product_identifier = False
+        if command == _STOP_COMMAND and not busy:
+            self._mode = SdpMeasurementMode.IDLE
+        elif command in _START_CONTINUOUS_COMMANDS and idle:
+            self._mode = SdpMeasurementMode.CONTINUOUS
+            self._measurement_ready_at = now + FIRST_RESULT_DELAY
+            self._result_index = None
+        elif command in _TRIGGER_COMMANDS and idle:
+            self._mode = SdpMeasurementMode.TRIGGERED
+            self._measurement_ready_at = now + TRIGGERED_MEASUREMENT_TIME
+            self._measurement_available = True
+        elif command == _ENTER_SLEEP_COMMAND and idle:
+            self._mode = SdpMeasurementMode.SLEEP
+        elif command == _PREPARE_PRODUCT_IDENTIFIER_COMMAND and idle:
+            self._product_identifier_prepared = True
+        elif command == _READ_PRODUCT_IDENTIFIER_COMMAND and idle and self._product_identifier_prepared:
+            self._read_product_identifier = True
+        else:
+            return False
+        if command != _PREPARE_PRODUCT_IDENTIFIER_COMMAND:
+            self._product_identifier_prepared = False
+        return True
+
+    def read(self, length, now):
+        """
+        Process a read operation.
+
+        :param int length: Number of bytes to read.
+        :param float now: The current time.
+        :return: The read data, or None if the read header is not acknowledged.
+        :rtype: bytes/None
+        """
+        if self._read_product_identifier:
+            return _add_crc(pack(">IQ", self.product_number, self.serial_number))[:length]
+        if self._mode is SdpMeasurementMode.CONTINUOUS:
+            if now < self._measurement_ready_at:
+                return None
+            index = int((now - self._measurement_ready_at) / UPDATE_INTERVAL)
+            if index != self._result_index:
+                self._result = _add_crc(self._measure())
+                self._result_index = index
+            return self._result[:length]
+        elif self._mode is SdpMeasurementMode.TRIGGERED:
+            if (now < self._measurement_ready_at) or not self._measurement_available:
+                return None
+            self._measurement_available = False
+        else:
+            return None
+        return _add_crc(self._measure())[:length]
+
+    def _measure(self):
+        differential_pressure = self.differential_pressure
+        if self.noise:
+            differential_pressure += self._random.gauss(0.0, self.noise)
+        ticks = int(round(differential_pressure * self.scale_factor))
+        temperature_ticks = int(round(self.temperature * 200.))
+        return pack(">hhh", max(-32768, min(32767, ticks)), max(-32768, min(32767, temperature_ticks)),
+                    self.scale_factor)
+
+
+class SdpSimulatedI2cTransceiver(I2cTransceiverV1):
+    """
+    I²C transceiver with simulated SDP sensors attached. It can be used with
+    :py:class:`~sensirion_i2c_driver.connection.I2cConnection` like any real
+    transceiver. Read delays are actually waited.
+    """
+
+    def __init__(self, sensors=None, latency=0.0):
+        """
+        Creates a transceiver.
+
+        :param dict sensors:
+            The simulated sensors (:py:class:`SdpSimulatedSensor`) attached to
+            the bus, by slave address. Defaults to a single sensor at 0x25.
+        :param float latency:
+            Additional time in seconds every transfer takes, e.g. to simulate
+            the round trip through a SensorBridge.
+        """
+        super(SdpSimulatedI2cTransceiver, self).__init__()
+        self.sensors = sensors if sensors is not None else {0x25: SdpSimulatedSensor()}
+        self.latency = latency
+        self.transfer_count = 0
+
+    @property
+    def description(self):
+        return "Simulated SDP transceiver"
+
+    @property
+    def channel_count(self):
+        return None
+
+    def transceive(self, slave_address, tx_data, rx_length, read_delay, timeout):
+        """
+        Transceive an I²C frame with the simulated sensor at the given
+        address. See
+        :py:meth:`~sensirion_i2c_driver.transceiver_v1.I2cTransceiverV1.transceive`.
+        """
+        self.transfer_count += 1
+        if self.latency > 0.0:
+            time.sleep(self.latency)
+        sensor = self.sensors.get(slave_address)
+        if sensor is None:
+            return self.STATUS_NACK, Exception("No device at address 0x{:02X}".format(slave_address)), b""
+        if (tx_data is not None) and not sensor.write(tx_data, time.monotonic()):
+            return self.STATUS_NACK, Exception("Write not acknowledged"), b""
+        if rx_length is None:
+            return self.STATUS_OK, None, b""
+        if read_delay > 0.0:
+            time.sleep(read_delay)
+        data = sensor.read(rx_length, time.monotonic())
+        if data is None:
+            return self.STATUS_NACK, Exception("Read not acknowledged"), b""
+        return self.STATUS_OK, None, data
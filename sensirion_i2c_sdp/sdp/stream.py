@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from sensirion_i2c_driver.errors import I2cError
+
+log = logging.getLogger(__name__)
+
+
+#: A single raw sample as acquired by :py:class:`SdpStream`. The timestamp is
+#: taken from :py:func:`time.monotonic` right after the read operation.
+#: ``fresh`` is False if the sample was read before the sensor was guaranteed
+#: to have updated its result since the last fresh sample, i.e. it may be a
+#: duplicate of the last fresh sample (see
+#: :py:attr:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.is_last_result_new`).
+#: Thus a fresh sample may still repeat the result of a preceding sample
+#: which was not fresh.
+#: ``settled`` is False if the sample was read during the first 20ms of the
+#: measurement, where small accuracy deviations can occur (see
+#: :py:attr:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.is_measurement_settled`).
+SdpSample = namedtuple('SdpSample', [
+    'timestamp',
+    'differential_pressure_ticks',
+    'temperature_ticks',
+    'scale_factor',
+    'fresh',
+    'settled',
+])
+
+
+class SdpStream(object):
+    """
+    Background acquisition of continuous measurement results.
+
+    :py:meth:`start` sends the start command of a continuous measurement
+    from the calling thread, and then a dedicated thread reads the results
+    at a fixed rate. :py:meth:`stop` joins the thread and stops the
+    measurement, again from the calling thread. The samples are stored as
+    raw ticks in a preallocated ring buffer from which they can be drained
+    in batches with :py:meth:`read`. If the buffer is full, the oldest
+    samples are overwritten and counted in :py:attr:`overflow_count`. Failed
+    I²C reads are counted in :py:attr:`error_count` and the acquisition
+    continues, whereas any other exception (e.g. of a SensorBridge
+    connection) ends the acquisition thread and is stored in
+    :py:attr:`last_error`.
+
+    The sensor updates its results only every 0.5ms, thus reading faster may
+    return the same result several times. Every sample is tagged whether it
+    is guaranteed to contain a new result (see :py:class:`SdpSample`), and
+    with ``drop_duplicates=True`` samples which may be duplicates are not
+    stored at all. Note that such a sample may still contain a new result,
+    thus dropping them limits the sample rate to the update rate of the
+    sensor. :py:attr:`unique_sample_rate` reports the achieved rate of
+    guaranteed new results. If the device paces its reads (see
+    :py:attr:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.pace_reads`), all
+    samples are new.
+
+    .. sourcecode:: python
+
+        with SdpStream(sdp, rate=200.0) as stream:
+            while True:
+                for sample in stream.read():
+                    print(sample.differential_pressure_ticks)
+                time.sleep(0.5)
+    """
+
+    def __init__(self, device, rate=100.0, buffer_size=4096, start_measurement=None, fast=False,
+                 drop_duplicates=False):
+        """
+        Creates a stream (the acquisition is not started yet).
+
+        :param ~sensirion_i2c_sdp.sdp.device.SdpI2cDevice device:
+            The device to read from.
+        :param float rate:
+            Target sample rate in Hz. Since the sensor updates its results
+            every 0.5ms, rates above 2kHz do not provide additional data.
+        :param int buffer_size:
+            Number of samples the ring buffer can hold.
+        :param callable start_measurement:
+            Function to start the continuous measurement, e.g.
+            ``sdp.start_continuous_measurement_with_mass_flow_t_comp``.
+            Defaults to
+            :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.start_continuous_measurement_with_diff_pressure_t_comp`.
+        :param bool fast:
+            If True, the results are read with
+            :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_measurement_fast`
+            instead of
+            :py:meth:`~sensirion_i2c_sdp.sdp.device.SdpI2cDevice.read_measurement`.
+        :param bool drop_duplicates:
+            If True, samples which may be duplicates of the previous sample
+            are dropped instead of being stored with ``fresh=False``.
+        :raise ValueError:
+            If an argument is invalid, or if the device is connected through
+            a multi-channel connection.
+        """
+        super(SdpStream, self).__init__()
+        if device.connection.is_multi_channel:
+            raise ValueError("Streams of multi-channel connections are not supported.")
+        if rate <= 0:
+            raise ValueError("The sample rate must be positive.")
+        if buffer_size < 1:
+            raise ValueError("The buffer size must be at least 1.")
+        self._device = device
+        self._period = 1.0 / rate
+        self._start_measurement = start_measurement or device.start_continuous_measurement_with_diff_pressure_t_comp
+        self._read_measurement = device.read_measurement_fast if fast else device.read_measurement
+        self._size = buffer_size
+        self._timestamps = [0.0] * buffer_size
+        self._differential_pressure_ticks = [0] * buffer_size
+        self._temperature_ticks = [0] * buffer_size
+        self._scale_factors = [0] * buffer_size
+        self._fresh = [False] * buffer_size
+        self._settled = [False] * buffer_size
+        self._drop_duplicates = drop_duplicates
+        self._last_fresh_timestamp = None
+        self._first_fresh_timestamp = None
+        self._fresh_count = 0
+        self._duplicate_count = 0
+        self._head = 0  # index of the oldest sample
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._overflow_count = 0
+        self._error_count = 0
+        self._last_error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def is_running(self):
+        """
+        Check whether the acquisition thread is running.
+
+        :type: bool
+        """
+        return (self._thread is not None) and self._thread.is_alive()
+
+    @property
+    def available(self):
+        """
+        Number of samples in the buffer which were not read yet.
+
+        :type: int
+        """
+        return self._count
+
+    @property
+    def overflow_count(self):
+        """
+        Number of samples which were overwritten because the buffer was full.
+
+        :type: int
+        """
+        return self._overflow_count
+
+    @property
+    def duplicate_count(self):
+        """
+        Number of samples which may be duplicates (stored or dropped), see
+        :py:class:`SdpSample`.
+
+        :type: int
+        """
+        return self._duplicate_count
+
+    @property
+    def unique_sample_rate(self):
+        """
+        The achieved rate in Hz of samples with a new result, or None if less
+        than two such samples were acquired.
+
+        :type: float/None
+        """
+        if self._fresh_count < 2 or self._last_fresh_timestamp <= self._first_fresh_timestamp:
+            return None
+        return (self._fresh_count - 1) / (self._last_fresh_timestamp - self._first_fresh_timestamp)
+
+    @property
+    def error_count(self):
+        """
+        Number of failed read operations (e.g. NACK or wrong CRC).
+
+        :type: int
+        """
+        return self._error_count
+
+    @property
+    def last_error(self):
+        """
+        The exception of the last failed read operation or the exception
+        which ended the acquisition thread, or None.
+
+        :type: Exception/None
+        """
+        return self._last_error
+
+    def start(self):
+        """
+        Start the continuous measurement and the acquisition thread.
+        """
+        if self.is_running:
+            raise RuntimeError("The stream is already running.")
+        self._start_measurement()
+        self._last_fresh_timestamp = None
+        self._first_fresh_timestamp = None
+        self._fresh_count = 0
+        self._duplicate_count = 0
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SdpStream")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the acquisition thread and the continuous measurement. Samples
+        which were not read yet are kept in the buffer.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._device.stop_continuous_measurement()
+
+    def read(self, max_count=None):
+        """
+        Remove the oldest samples from the buffer and return them.
+
+        :param int/None max_count:
+            Maximum number of samples to return, or None to return all
+            available samples.
+        :return: The samples, oldest first.
+        :rtype: list(SdpSample)
+        """
+        with self._lock:
+            count = self._count if max_count is None else min(max_count, self._count)
+            samples = []
+            index = self._head
+            for _ in range(count):
+                samples.append(SdpSample(self._timestamps[index], self._differential_pressure_ticks[index],
+                                         self._temperature_ticks[index], self._scale_factors[index],
+                                         self._fresh[index], self._settled[index]))
+                index = (index + 1) % self._size
+            self._head = index
+            self._count -= count
+        return samples
+
+    def _push(self, timestamp, differential_pressure, temperature, fresh, settled):
+        if fresh:
+            if self._first_fresh_timestamp is None:
+                self._first_fresh_timestamp = timestamp
+            self._last_fresh_timestamp = timestamp
+            self._fresh_count += 1
+        else:
+            self._duplicate_count += 1
+            if self._drop_duplicates:
+                return
+        with self._lock:
+            index = (self._head + self._count) % self._size
+            self._timestamps[index] = timestamp
+            self._differential_pressure_ticks[index] = differential_pressure.ticks
+            self._temperature_ticks[index] = temperature.ticks
+            self._scale_factors[index] = differential_pressure.scale_factor
+            self._fresh[index] = fresh
+            self._settled[index] = settled
+            if self._count == self._size:
+                self._head = (self._head + 1) % self._size
+                self._overflow_count += 1
+            else:
+                self._count += 1
+
+    def _run(self):
+        try:
+            self._acquire()
+        except Exception as e:
+            log.error("SdpStream acquisition failed: {}".format(e))
+            self._error_count += 1
+            self._last_error = e
+
+    def _acquire(self):
+        next_time = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                differential_pressure, temperature = self._read_measurement()
+            except I2cError as e:
+                log.debug("SdpStream read failed: {}".format(e))
+                self._error_count += 1
+                self._last_error = e
+            else:
+                # Taken after the read, since the device may wait for the
+                # next result before actually reading.
+                self._push(time.monotonic(), differential_pressure, temperature, self._device.is_last_result_new,
+                           self._device.is_measurement_settled)
+            # Schedule on absolute deadlines to avoid drift, but don't try to
+            # catch up with missed samples after a stall.
+            next_time += self._period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                next_time = time.monotonic()
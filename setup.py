@@ -23,6 +23,13 @@ extras_require = {
         'pytest-cov~=3.0.0',
         'sensirion-shdlc-sensorbridge~=0.1.1'
     ],
+    'numpy': [
+        'numpy',
+    ],
+    'scipy': [
+        'numpy',
+        'scipy',
+    ],
     'docs': [
         'sphinx~=2.2.1',
         'sphinx-rtd-theme~=0.4.3',
@@ -52,7 +59,7 @@ setup(
     license='BSD',
     keywords='I2C SDP8xx SDP3x Sensirion',
     url='http://developer.sensirion.com',
-    packages=find_packages(exclude=['tests', 'tests.*']),
+    packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']),
     long_description=long_description,
     python_requires=python_requires,
     install_requires=install_requires,
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+
+from sensirion_i2c_sdp.sdp.async_device import AsyncSdpI2cDevice, _connection_executors
+from sensirion_i2c_sdp.sdp.bus import SdpI2cBus
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+from .stubs import TransceiverStub
+
+
+def run(coroutine):
+    # run() requires Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_trigger_and_read():
+    transceiver = TransceiverStub()
+    sdp = AsyncSdpI2cDevice(I2cConnection(transceiver))
+    dp, temperature = run(sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging())
+    assert dp.pascal == -1.5
+    assert temperature.degrees_celsius == 25.0
+    assert sdp.device.measurement_mode is SdpMeasurementMode.IDLE
+    assert [t[2:] for t in transceiver.transfers] == [(b"\x36\x2F", 9, 0.045)]
+    sdp.close()
+
+
+def test_sensors_are_served_concurrently():
+    bus = SdpI2cBus(I2cConnection(TransceiverStub()))
+    devices = [AsyncSdpI2cDevice(bus, slave_address=address) for address in (0x21, 0x22, 0x23, 0x25, 0x26)]
+
+    async def measure_all():
+        return await asyncio.gather(*[
+            d.trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging() for d in devices])
+
+    start = time.monotonic()
+    results = run(measure_all())
+    assert time.monotonic() - start < 5 * 0.045
+    assert [dp.ticks for dp, _ in results] == [-90] * 5
+
+
+def test_continuous_measurement():
+    transceiver = TransceiverStub()
+    sdp = AsyncSdpI2cDevice(I2cConnection(transceiver))
+
+    async def measure():
+        await sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+        result = await sdp.read_measurement()
+        await sdp.stop_continuous_measurement()
+        return result
+
+    dp, _ = run(measure())
+    assert dp.ticks == -90
+    assert sdp.device.measurement_mode is SdpMeasurementMode.IDLE
+
+
+def test_close_shuts_down_shared_executor():
+    connection = I2cConnection(TransceiverStub())
+
+    async def measure():
+        async with AsyncSdpI2cDevice(connection, slave_address=0x21) as sdp_1:
+            async with AsyncSdpI2cDevice(connection, slave_address=0x22) as sdp_2:
+                await sdp_2.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+            executor, users = _connection_executors[connection]
+            assert users == 1
+            await sdp_1.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+        return executor
+
+    executor = run(measure())
+    assert connection not in _connection_executors
+    with pytest.raises(RuntimeError):
+        executor.submit(time.monotonic)
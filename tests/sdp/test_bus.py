@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import threading
+import time
+
+from sensirion_i2c_driver import I2cCommand, I2cConnection
+
+from sensirion_i2c_sdp.sdp.bus import SdpI2cBus, _TicketLock
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdBase
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+from .stubs import TransceiverStub
+
+
+def test_read_delay_splits_transfer():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(SdpI2cBus(I2cConnection(transceiver)))
+    dp, temperature = sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert (dp.ticks, temperature.ticks) == (-90, 5000)
+    (write_time, _, tx_data, rx_length, _), (read_time, _, read_tx_data, read_length, _) = transceiver.transfers
+    assert (tx_data, rx_length, read_tx_data, read_length) == (b"\x36\x2F", None, None, 9)
+    assert read_time - write_time >= 0.045
+
+
+def test_read_without_data_is_not_interpreted():
+    transceiver = TransceiverStub()
+    command = SdpI2cCmdBase(command=0x362F, tx_data=None, rx_length=0, read_delay=0.001, timeout=0)
+    assert SdpI2cBus(I2cConnection(transceiver)).execute(0x25, command) is None
+    assert [t[3] for t in transceiver.transfers] == [None, 0]
+
+
+def test_foreign_command_not_split():
+    transceiver = TransceiverStub()
+    command = I2cCommand(b"\x36\x2F", 9, 0.001, 0)
+    assert len(SdpI2cBus(I2cConnection(transceiver)).execute(0x25, command)) == 9
+    assert [t[2:] for t in transceiver.transfers] == [(b"\x36\x2F", 9, 0.001)]
+
+
+def test_devices_measure_concurrently():
+    transceiver = SdpSimulatedI2cTransceiver({
+        0x21: SdpSimulatedSensor(differential_pressure=1.0),
+        0x22: SdpSimulatedSensor(differential_pressure=2.0),
+    })
+    bus = SdpI2cBus(I2cConnection(transceiver))
+    results = {}
+
+    def measure(address):
+        sdp = SdpI2cDevice(bus, slave_address=address)
+        results[address] = [sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()[0].pascal
+                            for _ in range(3)]
+
+    threads = [threading.Thread(target=measure, args=(address,)) for address in (0x21, 0x22)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {0x21: [1.0] * 3, 0x22: [2.0] * 3}
+    # the measurements of both sensors overlap
+    assert time.monotonic() - start < 6 * 0.045
+
+
+def test_ticket_lock_is_fair():
+    lock = _TicketLock()
+    order = []
+    lock.acquire()
+    threads = []
+    for i in range(5):
+        thread = threading.Thread(target=lambda i=i: (lock.acquire(), order.append(i), lock.release()))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.01)  # make sure the threads queue up in order
+    lock.release()
+    for thread in threads:
+        thread.join()
+    assert order == [0, 1, 2, 3, 4]
@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function
 import pytest
 from sensirion_i2c_driver.errors import I2cNackError
 
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
 from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure, SdpTemperature
 
 
@@ -70,6 +71,44 @@ def test_read_measurement_single_shot_2(sdp):
     assert_measurement_result(dp, temperature)
 
 
+@pytest.mark.needs_device
+@pytest.mark.needs_sdp
+def test_measurement_mode(sdp):
+    assert sdp.measurement_mode is SdpMeasurementMode.IDLE
+    sdp.start_continuous_measurement_with_mass_flow_t_comp()
+    assert sdp.measurement_mode is SdpMeasurementMode.CONTINUOUS
+    dp, temperature = sdp.read_measurement()
+    assert_measurement_result(dp, temperature)
+    sdp.stop_continuous_measurement()
+    assert sdp.measurement_mode is SdpMeasurementMode.IDLE
+    sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+    assert sdp.measurement_mode is SdpMeasurementMode.TRIGGERED
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sdp
+def test_read_measurement_fast(sdp):
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    for _ in range(3):
+        dp, temperature = sdp.read_measurement_fast()
+        assert_measurement_result(dp, temperature)
+    sdp.stop_continuous_measurement()
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sdp
+def test_trigger_and_read_measurement_1(sdp):
+    dp, temperature = sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert_measurement_result(dp, temperature)
+
+
+@pytest.mark.needs_device
+@pytest.mark.needs_sdp
+def test_trigger_and_read_measurement_2(sdp):
+    dp, temperature = sdp.trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging()
+    assert_measurement_result(dp, temperature)
+
+
 def assert_measurement_result(dp, temperature):
     assert type(dp) is SdpDifferentialPressure
     assert type(dp.ticks) is int
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+from struct import pack
+
+import pytest
+from sensirion_i2c_driver import CrcCalculator
+from sensirion_i2c_driver.errors import I2cChecksumError
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdReadMeasurement, SdpI2cCmdReadProductIdentifier
+from sensirion_i2c_sdp.sdp.crc import calculate_crc, strip_crc
+
+reference_crc = CrcCalculator(8, 0x31, 0xFF, 0x00)
+
+
+def add_crc(data):
+    data = bytearray(data)
+    result = bytearray()
+    for i in range(0, len(data), 2):
+        result += data[i:i + 2] + bytearray([reference_crc(data[i:i + 2])])
+    return bytes(result)
+
+
+@pytest.mark.parametrize("word", [0x0000, 0xBEEF, 0xFFFF, 0x003C, 0x1388, 0x8000])
+def test_calculate_crc(word):
+    data = bytearray([word >> 8, word & 0xFF])
+    assert calculate_crc(data) == reference_crc(data)
+
+
+def test_strip_crc_all_words():
+    data = add_crc(pack(">{}H".format(0x10000), *range(0x10000)))
+    assert strip_crc(data) == pack(">{}H".format(0x10000), *range(0x10000))
+
+
+def test_strip_crc_empty():
+    assert strip_crc(b"") is None
+
+
+def test_strip_crc_wrong_crc():
+    data = bytearray(add_crc(b"\x00\x3C\x13\x88"))
+    data[5] ^= 0xFF
+    with pytest.raises(I2cChecksumError) as e:
+        strip_crc(bytes(data))
+    assert e.value.received_checksum == data[5]
+    assert e.value.expected_checksum == reference_crc(b"\x13\x88")
+
+
+def test_read_measurement_interpret_response():
+    dp, temperature = SdpI2cCmdReadMeasurement().interpret_response(add_crc(pack(">hhh", -90, 5000, 60)))
+    assert dp.ticks == -90
+    assert dp.scale_factor == 60
+    assert temperature.ticks == 5000
+
+
+def test_read_product_identifier_interpret_response():
+    data = add_crc(pack(">IQ", 0x03020A01, 0x0123456789ABCDEF))
+    assert SdpI2cCmdReadProductIdentifier().interpret_response(data) == (0x03020A01, 0x0123456789ABCDEF)
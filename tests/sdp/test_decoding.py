@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import math
+from struct import pack
+
+import pytest
+from sensirion_i2c_driver import CrcCalculator
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdReadMeasurement
+from sensirion_i2c_sdp.sdp.decoding import decode_measurement_frames
+
+np = pytest.importorskip("numpy")
+
+
+def build_frame(dp_ticks, temperature_ticks, scale_factor):
+    crc = CrcCalculator(8, 0x31, 0xFF, 0x00)
+    data = pack(">hhh", dp_ticks, temperature_ticks, scale_factor)
+    frame = bytearray()
+    for i in range(0, len(data), 2):
+        frame += data[i:i + 2] + bytearray([crc(bytearray(data[i:i + 2]))])
+    return bytes(frame)
+
+
+def test_decode_matches_interpret_response():
+    values = [(60, 5000, 60), (-90, -5000, 60), (0, 0, 240), (32767, 20000, 20), (-32768, -1, 60)]
+    data = b"".join(build_frame(*v) for v in values)
+    result = decode_measurement_frames(memoryview(data))
+    assert result.valid.all()
+    for i, v in enumerate(values):
+        dp, temperature = SdpI2cCmdReadMeasurement().interpret_response(build_frame(*v))
+        assert result.differential_pressure_ticks[i] == dp.ticks
+        assert result.temperature_ticks[i] == temperature.ticks
+        assert result.scale_factor[i] == dp.scale_factor
+        assert result.pascal[i] == pytest.approx(dp.pascal)
+        assert result.degrees_celsius[i] == pytest.approx(temperature.degrees_celsius)
+
+
+def test_decode_reports_crc_errors():
+    frames = bytearray(build_frame(60, 5000, 60) * 3)
+    frames[9 + 5] ^= 0x01  # corrupt the temperature CRC of the second frame
+    result = decode_measurement_frames(bytes(frames))
+    assert list(result.valid) == [True, False, True]
+    assert math.isnan(result.pascal[1])
+    assert math.isnan(result.degrees_celsius[1])
+    assert result.pascal[0] == 1.0
+
+
+def test_decode_empty():
+    result = decode_measurement_frames(b"")
+    assert len(result.valid) == 0
+
+
+def test_decode_invalid_length():
+    with pytest.raises(ValueError):
+        decode_measurement_frames(b"\x00" * 10)
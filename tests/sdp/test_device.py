@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pytest
+
+from sensirion_i2c_driver import I2cConnection
+
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.instrumentation import SdpObserver
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+from .stubs import TransceiverStub
+
+
+def test_trigger_and_read_single_transfer():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    dp, temperature = sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert (dp.ticks, temperature.ticks) == (-90, 5000)
+    assert sdp.measurement_mode is SdpMeasurementMode.IDLE
+    assert len(transceiver.transfers) == 1
+    _, address, tx_data, rx_length, read_delay = transceiver.transfers[0]
+    assert (address, tx_data, rx_length, read_delay) == (0x25, b"\x36\x2F", 9, 0.045)
+
+
+def test_post_processing_awaited_before_next_command():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    start = time.monotonic()
+    sdp.trigger_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert time.monotonic() - start < 0.040
+    assert sdp.ready_at == pytest.approx(start + 0.045, abs=0.005)
+    sdp.read_measurement()
+    (trigger_time, _, _, _, _), (read_time, _, _, _, _) = transceiver.transfers
+    assert read_time - trigger_time >= 0.045
+    assert sdp.wait_until_ready() == 0.0
+
+
+def test_read_delay_only_in_unknown_mode():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    sdp.read_measurement()
+    sdp.trigger_measurement_with_diff_pressure_t_comp_and_averaging()
+    sdp.read_measurement()
+    sdp.read_measurement_fast()
+    read_delays = [read_delay for _, _, _, _, read_delay in transceiver.transfers]
+    assert read_delays == [0.001, 0.0, 0.0, 0.0]
+
+
+def test_continuous_measurement_warm_up(simulated_sdp, sdp_simulator):
+    simulated_sdp.pace_reads = True
+    assert simulated_sdp.measurement_started_at is None
+    simulated_sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    started_at = simulated_sdp.measurement_started_at
+    assert simulated_sdp.result_available_at == pytest.approx(started_at + 0.008)
+    # the first read waits for the first result instead of being NACKed
+    simulated_sdp.read_measurement()
+    assert time.monotonic() - started_at >= 0.008
+    assert not simulated_sdp.is_measurement_settled
+    time.sleep(0.020)
+    assert simulated_sdp.is_measurement_settled
+    simulated_sdp.stop_continuous_measurement()
+    assert simulated_sdp.measurement_started_at is None
+    assert not simulated_sdp.is_measurement_settled
+
+
+def test_continuous_reads_paced_to_update_interval():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver), pace_reads=True)
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    for _ in range(5):
+        sdp.read_measurement_fast()
+    times = [t for t, _, _, rx_length, _ in transceiver.transfers if rx_length]
+    assert times[0] - transceiver.transfers[0][0] >= 0.008
+    assert all(b - a >= 0.0005 for a, b in zip(times, times[1:]))
+
+
+def test_continuous_reads_not_paced_by_default():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    assert sdp.ready_at - sdp.measurement_started_at == pytest.approx(0.010)
+    for _ in range(5):
+        sdp.read_measurement_fast()
+    times = [t for t, _, _, rx_length, _ in transceiver.transfers if rx_length]
+    assert times[0] - transceiver.transfers[0][0] >= 0.010
+    assert times[-1] - times[0] < 0.0005 * (len(times) - 1)
+
+
+def test_product_identifier_cached_per_connection_and_address(sdp_simulator):
+    connection = I2cConnection(sdp_simulator)
+    assert SdpI2cDevice(connection).read_product_identifier() == (0x03020A01, 0x0123456789ABCDEF)
+    count = sdp_simulator.transfer_count
+    sdp = SdpI2cDevice(connection)
+    assert sdp.read_product_identifier() == (0x03020A01, 0x0123456789ABCDEF)
+    assert sdp_simulator.transfer_count == count
+    sdp_simulator.sensors[0x25].serial_number = 42
+    assert sdp.read_product_identifier(refresh=True) == (0x03020A01, 42)
+    sdp_simulator.sensors[0x25].serial_number = 43
+    sdp.invalidate_product_identifier()
+    assert sdp.read_product_identifier() == (0x03020A01, 43)
+    assert sdp_simulator.transfer_count == count + 4
+
+
+def test_read_differential_pressure_unknown_product_reads_full_measurement():
+    transceiver = TransceiverStub()
+    sdp = SdpI2cDevice(I2cConnection(transceiver))
+    assert sdp.read_differential_pressure().pascal == -1.5  # unknown product, full read
+    assert transceiver.transfers[-1][3] == 9
+
+
+@pytest.mark.parametrize("product_number, scale_factor", [
+    (0x03020B01, 240),  # SDP810-125Pa
+    (0x03010301, 20),  # SDP33
+])
+def test_read_differential_pressure_with_product_scale_factor(product_number, scale_factor):
+    class CommandRecorder(SdpObserver):
+        def __init__(self):
+            self.commands = []
+
+        def on_command(self, device, command, bus_time, read_delay, wait_time, error):
+            self.commands.append(type(command).__name__)
+
+    sensor = SdpSimulatedSensor(product_number=product_number, scale_factor=scale_factor, differential_pressure=2.5)
+    sdp = SdpI2cDevice(I2cConnection(SdpSimulatedI2cTransceiver({0x25: sensor})))
+    assert sdp.read_product().scale_factor == scale_factor
+    sdp.trigger_measurement_with_diff_pressure_t_comp_and_averaging()
+    sdp.observer = CommandRecorder()
+    dp = sdp.read_differential_pressure()
+    assert (dp.ticks, dp.scale_factor, dp.pascal) == (2.5 * scale_factor, scale_factor, 2.5)
+    assert sdp.observer.commands == ["SdpI2cCmdReadDifferentialPressure"]
+
+
+def test_read_differential_pressure_skips_scale_factor(simulated_sdp, sdp_simulator):
+    sdp_simulator.sensors[0x25].differential_pressure = 2.0
+    assert simulated_sdp.read_product().scale_factor == 60
+    simulated_sdp.trigger_measurement_with_diff_pressure_t_comp_and_averaging()
+    dp = simulated_sdp.read_differential_pressure()
+    assert (dp.ticks, dp.scale_factor, dp.pascal) == (120, 60, 2.0)
+
+
+def test_read_measurement_multi_channel():
+    transceiver = TransceiverStub()
+    connection = I2cConnection(transceiver)
+    connection.always_multi_channel_response = True
+    sdp = SdpI2cDevice(connection)
+    ((dp, temperature),) = sdp.read_measurement()
+    assert (dp.ticks, temperature.ticks) == (-90, 5000)
+    ((dp, temperature),) = sdp.read_measurement_fast()
+    assert dp.ticks == -90
+    (dp,) = sdp.read_differential_pressure()
+    assert dp.pascal == -1.5
+    ((dp, _),) = sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert dp.ticks == -90
+    assert all(rx_length == 9 for _, _, _, rx_length, _ in transceiver.transfers)
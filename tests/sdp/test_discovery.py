@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from sensirion_i2c_driver import I2cConnection
+
+from sensirion_i2c_sdp.sdp.discovery import discover_devices, get_slave_addresses, probe_connection
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+
+
+def test_slave_addresses():
+    assert get_slave_addresses() == [0x21, 0x22, 0x23, 0x25, 0x26]
+
+
+def test_probe_connection():
+    transceiver = SdpSimulatedI2cTransceiver({
+        0x21: SdpSimulatedSensor(product_number=0x03010101, serial_number=1),
+        0x26: SdpSimulatedSensor(serial_number=2),
+    })
+    devices = probe_connection(I2cConnection(transceiver))
+    assert [d.slave_address for d in devices] == [0x21, 0x26]
+    count = transceiver.transfer_count
+    assert [d.read_product().name for d in devices] == ["SDP31", "SDP810-500Pa"]
+    assert transceiver.transfer_count == count
+
+
+def test_discover_devices_concurrently():
+    transceivers = [SdpSimulatedI2cTransceiver({0x25: SdpSimulatedSensor(serial_number=i)}, latency=0.01)
+                    for i in range(4)]
+    start = time.monotonic()
+    devices = discover_devices([I2cConnection(t) for t in transceivers])
+    duration = time.monotonic() - start
+    assert [d.read_product_identifier()[1] for d in devices] == [0, 1, 2, 3]
+    # 5 addresses per bus, the buses are probed in parallel
+    assert duration < 4 * 5 * 0.01
+
+
+def test_discover_no_connections():
+    assert discover_devices([]) == []
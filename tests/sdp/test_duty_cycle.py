@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.duty_cycle import SdpDutyCycleScheduler
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+
+
+@pytest.fixture
+def sensors():
+    return {0x21: SdpSimulatedSensor(differential_pressure=1.0), 0x22: SdpSimulatedSensor(differential_pressure=2.0)}
+
+
+@pytest.fixture
+def scheduler(sensors):
+    connection = I2cConnection(SdpSimulatedI2cTransceiver(sensors))
+    return SdpDutyCycleScheduler([SdpI2cDevice(connection, address) for address in sorted(sensors)], period=0.1)
+
+
+def test_measure_wakes_up_and_sleeps(scheduler, sensors):
+    for _ in range(2):
+        start = time.monotonic()
+        results = scheduler.measure()
+        # both sensors measure in parallel
+        assert time.monotonic() - start < 2 * 0.045
+        assert [dp.pascal for dp, _ in results] == [1.0, 2.0]
+        assert all(sensor.mode is SdpMeasurementMode.SLEEP for sensor in sensors.values())
+    assert scheduler.cycle_count == 2
+    assert all(0.045 < awake_time < 2 * 0.06 for awake_time in scheduler.awake_times)
+
+
+def test_measure_stops_continuous_measurement(scheduler, sensors):
+    scheduler.devices[0].start_continuous_measurement_with_diff_pressure_t_comp()
+    results = scheduler.measure()
+    assert [dp.pascal for dp, _ in results] == [1.0, 2.0]
+    assert all(sensor.mode is SdpMeasurementMode.SLEEP for sensor in sensors.values())
+
+
+def test_missing_sensor(scheduler, sensors):
+    del sensors[0x21]
+    results = scheduler.measure()
+    assert isinstance(results[0], I2cNackError)
+    assert results[1][0].pascal == 2.0
+
+
+def test_measurements_period(scheduler):
+    timestamps = [timestamp for timestamp, _ in scheduler.measurements(count=3)]
+    assert len(timestamps) == 3
+    assert all(0.095 < b - a < 0.15 for a, b in zip(timestamps, timestamps[1:]))
+
+
+def test_invalid_period():
+    with pytest.raises(ValueError):
+        SdpDutyCycleScheduler([], period=0)
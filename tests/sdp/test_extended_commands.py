@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+from struct import pack
+
+import pytest
+from sensirion_i2c_driver.errors import I2cChecksumError
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdReadMeasurement, SdpI2cCmdReadProductIdentifier, \
+    SdpI2cCmdTriggerMeasurementWithDiffPressureTComp
+from sensirion_i2c_sdp.sdp.extended_commands import SdpI2cCmdReadMeasurementFast, \
+    SdpI2cCmdReadProductIdentifierFast, SdpI2cCmdReadDifferentialPressure, SdpI2cCmdTriggerAndReadMeasurement
+from .test_crc import add_crc
+
+MEASUREMENT_FRAME = add_crc(pack(">hhh", -90, 5000, 60))
+
+
+@pytest.mark.parametrize("read_delay", [0.001, 0.0])
+def test_read_measurement_fast(read_delay):
+    command = SdpI2cCmdReadMeasurementFast(read_delay=read_delay)
+    reference = SdpI2cCmdReadMeasurement()
+    assert isinstance(command, SdpI2cCmdReadMeasurement)
+    assert (command.tx_data, command.rx_length, command.read_delay) == (reference.tx_data, 9, read_delay)
+    dp, temperature = command.interpret_response(MEASUREMENT_FRAME)
+    assert (dp.ticks, dp.scale_factor, temperature.ticks) == (-90, 60, 5000)
+
+
+def test_read_measurement_fast_wrong_crc():
+    data = bytearray(MEASUREMENT_FRAME)
+    data[8] ^= 0xFF
+    with pytest.raises(I2cChecksumError):
+        SdpI2cCmdReadMeasurementFast().interpret_response(bytes(data))
+
+
+def test_read_product_identifier_fast():
+    command = SdpI2cCmdReadProductIdentifierFast()
+    reference = SdpI2cCmdReadProductIdentifier()
+    assert (command.tx_data, command.rx_length, command.read_delay) == \
+        (reference.tx_data, reference.rx_length, reference.read_delay)
+    data = add_crc(pack(">IQ", 0x03020A01, 0x0123456789ABCDEF))
+    assert command.interpret_response(data) == (0x03020A01, 0x0123456789ABCDEF)
+    corrupted = bytearray(data)
+    corrupted[17] ^= 0xFF
+    with pytest.raises(I2cChecksumError):
+        command.interpret_response(bytes(corrupted))
+
+
+def test_read_differential_pressure():
+    command = SdpI2cCmdReadDifferentialPressure(read_delay=0.0)
+    assert (command.tx_data, command.rx_length, command.read_delay) == (None, 3, 0.0)
+    assert command.interpret_response(MEASUREMENT_FRAME[0:3]) == -90
+
+
+def test_trigger_and_read_measurement():
+    command = SdpI2cCmdTriggerAndReadMeasurement(SdpI2cCmdTriggerMeasurementWithDiffPressureTComp())
+    assert (command.tx_data, command.rx_length, command.read_delay) == (b"\x36\x2F", 9, 0.045)
+    assert command.post_processing_time == 0.0
+    dp, temperature = command.interpret_response(MEASUREMENT_FRAME)
+    assert (dp.ticks, dp.scale_factor, temperature.ticks) == (-90, 60, 5000)
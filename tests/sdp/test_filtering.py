@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+
+from sensirion_i2c_sdp.sdp.filtering import SdpFilter, lowpass_fir, moving_average
+from sensirion_i2c_sdp.sdp.stream import SdpSample
+
+np = pytest.importorskip("numpy")
+
+
+def signal(count=1000):
+    timestamps = np.arange(count) * 0.0005
+    ticks = np.rint(60 * (10.0 + np.sin(2 * np.pi * 5 * timestamps) + 0.5 * np.sin(2 * np.pi * 800 * timestamps)))
+    return timestamps, ticks.astype(np.int16)
+
+
+def test_chunking_does_not_change_result():
+    timestamps, ticks = signal()
+    expected = SdpFilter(lowpass_fir(50.0, 2000.0), decimation=7).process(timestamps, ticks, 60)
+    lowpass = SdpFilter(lowpass_fir(50.0, 2000.0), decimation=7)
+    parts = [lowpass.process(timestamps[i:i + n], ticks[i:i + n], 60)
+             for i, n in zip(range(0, 1000, 97), [97] * 11)]
+    assert np.allclose(np.concatenate([p.pascal for p in parts]), expected.pascal)
+    assert np.array_equal(np.concatenate([p.timestamps for p in parts]), expected.timestamps)
+    assert len(expected.pascal) == len(range(0, 1000, 7))
+
+
+def test_lowpass_removes_high_frequency():
+    timestamps, ticks = signal()
+    result = SdpFilter(lowpass_fir(50.0, 2000.0, taps=101)).process(timestamps, ticks, 60)
+    low = 10.0 + np.sin(2 * np.pi * 5 * timestamps)
+    assert np.max(np.abs(result.pascal[100:] - low[50:-50])) < 0.05
+
+
+def test_moving_average_and_response_objects():
+    samples = [SdpSample(i * 0.0005, 60 * (i % 2), 5000, 60, True, True) for i in range(8)]
+    average = SdpFilter(moving_average(2), decimation=2)
+    result = average.process_samples(samples)
+    # start-up without transient: the state is initialized with the first sample
+    assert list(result.pascal) == [0.0, 0.5, 0.5, 0.5]
+    assert [dp.ticks for dp in result.to_differential_pressures()] == [0, 30, 30, 30]
+    assert all(dp.scale_factor == 60 for dp in result.to_differential_pressures())
+    assert len(average.process_samples([]).pascal) == 0
+
+
+def test_iir():
+    signal_ = pytest.importorskip("scipy.signal")
+    b, a = signal_.butter(2, 50.0, fs=2000.0)
+    timestamps, ticks = signal()
+    expected = SdpFilter(b, a, decimation=5).process(timestamps, ticks, 60)
+    iir = SdpFilter(b, a, decimation=5)
+    parts = [iir.process(timestamps[i:i + 100], ticks[i:i + 100], 60) for i in range(0, 1000, 100)]
+    assert np.allclose(np.concatenate([p.pascal for p in parts]), expected.pascal)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        SdpFilter([1.0], decimation=0)
+    with pytest.raises(ValueError):
+        lowpass_fir(1000.0, 2000.0)
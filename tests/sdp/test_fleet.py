@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import functools
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.fleet import SAMPLE_FORMAT, SdpFleet, decode_batch
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+
+
+def create_devices(differential_pressures):
+    sensors = {0x21 + i: SdpSimulatedSensor(differential_pressure=dp) for i, dp in enumerate(differential_pressures)}
+    connection = I2cConnection(SdpSimulatedI2cTransceiver(sensors))
+    return [SdpI2cDevice(connection, address) for address in sorted(sensors)]
+
+
+def fail():
+    raise RuntimeError("no bridge")
+
+
+def test_decode_batch():
+    assert SAMPLE_FORMAT.size == 16
+    data = SAMPLE_FORMAT.pack(1.5, 2, -90, 5000, 60) + SAMPLE_FORMAT.pack(2.5, 0, 1, 2, 3)
+    assert decode_batch(7, data) == [(1.5, 7, 2, -90, 5000, 60), (2.5, 7, 0, 1, 2, 3)]
+
+
+def test_fleet_acquires_from_all_shards():
+    factories = [functools.partial(create_devices, (1.0, 2.0)), functools.partial(create_devices, (3.0,))]
+    with SdpFleet(factories, rate=200.0, batch_interval=0.02) as fleet:
+        time.sleep(0.3)
+        samples = fleet.read()
+    samples += fleet.read()
+    assert not fleet.is_running
+    assert fleet.worker_errors == []
+    pascal = {(s.shard, s.device): s.differential_pressure_ticks / s.scale_factor for s in samples}
+    assert pascal == {(0, 0): 1.0, (0, 1): 2.0, (1, 0): 3.0}
+    assert len([s for s in samples if (s.shard, s.device) == (1, 0)]) > 10
+
+
+def test_fleet_samples_at_rate_from_start():
+    with SdpFleet([functools.partial(create_devices, (1.0,))], rate=100.0, batch_interval=10.0) as fleet:
+        time.sleep(0.3)
+    timestamps = [sample.timestamp for sample in fleet.read()]
+    assert len(timestamps) > 3
+    # no batch interval gap before the second sample
+    assert max(b - a for a, b in zip(timestamps, timestamps[1:])) < 0.1
+
+
+def test_fleet_read_batches_after_stop():
+    with SdpFleet([functools.partial(create_devices, (1.0,))], rate=100.0, batch_interval=10.0) as fleet:
+        time.sleep(0.1)
+    batches = fleet.read_batches()
+    assert len(batches) > 0
+    assert all(shard == 0 for shard, _ in batches)
+    assert len(decode_batch(0, b"".join(data for _, data in batches))) > 3
+    assert fleet.read_batches() == []
+    assert fleet.read() == []
+
+
+def test_fleet_reports_worker_errors():
+    with SdpFleet([fail]) as fleet:
+        assert fleet.read(timeout=None) == []
+    assert fleet.worker_errors == [(0, "RuntimeError: no bridge")]
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        SdpFleet([], rate=0)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import math
+
+import pytest
+
+from sensirion_i2c_sdp.sdp import flow as flow_module
+from sensirion_i2c_sdp.sdp.decoding import decode_measurement_frames
+from sensirion_i2c_sdp.sdp.flow import SdpFlowConverter, SdpFlowElement, _get_pressure_table, \
+    _get_temperature_table
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure, SdpTemperature
+
+np = pytest.importorskip("numpy")
+
+
+def expected_flow(ticks, temperature_ticks, scale_factor, element):
+    pascal = ticks / scale_factor
+    kelvin = temperature_ticks / 200. + 273.15
+    return element.gain * math.copysign(abs(pascal) ** element.exponent, pascal) * \
+        (kelvin / (element.reference_temperature + 273.15)) ** element.temperature_exponent
+
+
+@pytest.mark.parametrize("element", [
+    SdpFlowElement(gain=0.9),
+    SdpFlowElement(gain=2.0, exponent=1.0),
+    SdpFlowElement(gain=0.5, exponent=0.5, temperature_exponent=0.5, reference_temperature=0.0),
+])
+def test_convert(element):
+    converter = SdpFlowConverter(element)
+    for ticks, temperature_ticks, scale_factor in [(0, 5000, 60), (6000, 5000, 60), (-6000, -2000, 60),
+                                                   (32767, 0, 240), (-32768, 8000, 20)]:
+        flow = converter.convert(SdpDifferentialPressure(ticks, scale_factor), SdpTemperature(temperature_ticks))
+        assert flow == pytest.approx(expected_flow(ticks, temperature_ticks, scale_factor, element))
+
+
+def test_convert_ticks():
+    element = SdpFlowElement(gain=0.5, temperature_exponent=0.5)
+    converter = SdpFlowConverter(element)
+    ticks = np.array([-32768, -60, 0, 60, 240, 32767], dtype=np.int16)
+    temperature_ticks = np.array([0, 2000, 4000, 5000, 6000, 8000], dtype=np.int16)
+    flow = converter.convert_ticks(ticks, 60, temperature_ticks)
+    assert flow == pytest.approx([expected_flow(t, tt, 60, element) for t, tt in zip(ticks, temperature_ticks)])
+    scale_factors = np.array([60, 60, 240, 240, 20, 20])
+    flow = converter.convert_ticks(ticks, scale_factors, temperature_ticks)
+    assert flow == pytest.approx([expected_flow(int(t), int(tt), int(s), element)
+                                  for t, tt, s in zip(ticks, temperature_ticks, scale_factors)])
+
+
+def test_convert_ticks_without_temperature():
+    converter = SdpFlowConverter(SdpFlowElement(gain=1.0))
+    assert list(converter.convert_ticks([60 * 4, -60 * 9], 60)) == [2.0, -3.0]
+
+
+def test_tables_shared_by_elements():
+    assert _get_pressure_table(SdpFlowElement(1.0), 60) is _get_pressure_table(SdpFlowElement(2.5), 60)
+    assert _get_pressure_table(SdpFlowElement(1.0), 60) is not _get_pressure_table(SdpFlowElement(1.0, 1.0), 60)
+    assert not _get_pressure_table(SdpFlowElement(1.0), 60).flags.writeable
+    element = SdpFlowElement(1.0, temperature_exponent=0.5)
+    assert _get_temperature_table(element) is _get_temperature_table(element._replace(gain=3.0))
+
+
+def test_temperature_required():
+    converter = SdpFlowConverter(SdpFlowElement(gain=1.0, temperature_exponent=0.5))
+    with pytest.raises(ValueError):
+        converter.convert(SdpDifferentialPressure(60, 60))
+    with pytest.raises(ValueError):
+        converter.convert_ticks([60], 60)
+
+
+def test_invalid_scale_factor():
+    converter = SdpFlowConverter(SdpFlowElement(gain=1.0))
+    with pytest.raises(ValueError):
+        converter.convert(SdpDifferentialPressure(60, 0))
+    with pytest.raises(ValueError):
+        converter.convert_ticks([60], 0)
+    flow = converter.convert_ticks([240, 240, 240], np.array([60, 0, -60]))
+    assert flow[0] == 2.0
+    assert np.isnan(flow[1:]).all()
+
+
+def test_invalid_samples_are_nan():
+    converter = SdpFlowConverter(SdpFlowElement(gain=1.0))
+    flow = converter.convert_ticks([240, 240], 60, valid=[True, False])
+    assert flow[0] == 2.0
+    assert np.isnan(flow[1])
+    flow = converter.convert_ticks([240, 240], np.array([60, 60]), valid=[False, True])
+    assert np.isnan(flow[0])
+    assert flow[1] == 2.0
+
+
+def test_corrupted_frames(monkeypatch):
+    monkeypatch.setattr(flow_module, '_pressure_tables', flow_module.OrderedDict())
+    frames = decode_measurement_frames(np.random.RandomState(0).bytes(9 * 1000))
+    converter = SdpFlowConverter(SdpFlowElement(gain=1.0))
+    flow = converter.convert_ticks(frames.differential_pressure_ticks, frames.scale_factor,
+                                   frames.temperature_ticks, frames.valid)
+    assert np.isnan(flow[~frames.valid]).all()
+    assert len(flow_module._pressure_tables) <= flow_module._MAX_TABLES
+
+
+def test_table_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(flow_module, '_pressure_tables', flow_module.OrderedDict())
+    element = SdpFlowElement(gain=1.0)
+    first = _get_pressure_table(element, 1)
+    for scale_factor in range(2, flow_module._MAX_TABLES + 1):
+        _get_pressure_table(element, scale_factor)
+    assert _get_pressure_table(element, 1) is first  # most recently used now
+    _get_pressure_table(element, flow_module._MAX_TABLES + 1)
+    assert len(flow_module._pressure_tables) == flow_module._MAX_TABLES
+    assert (element.exponent, 2) not in flow_module._pressure_tables
+    assert _get_pressure_table(element, 1) is first
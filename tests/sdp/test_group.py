@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.group import SdpI2cDeviceGroup
+from .stubs import TransceiverStub
+
+ADDRESSES = (0x21, 0x22, 0x23, 0x25, 0x26)
+
+
+def test_triggers_are_interleaved():
+    transceiver = TransceiverStub()
+    connection = I2cConnection(transceiver)
+    group = SdpI2cDeviceGroup([SdpI2cDevice(connection, address) for address in ADDRESSES])
+    start = time.monotonic()
+    results = group.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert time.monotonic() - start < 2 * 0.045
+    assert [dp.ticks for dp, _ in results] == [-90] * len(ADDRESSES)
+    triggers = transceiver.transfers[:len(ADDRESSES)]
+    reads = transceiver.transfers[len(ADDRESSES):]
+    assert [t[3] for t in triggers] == [None] * len(ADDRESSES)
+    assert [t[3] for t in reads] == [9] * len(ADDRESSES)
+    for trigger, read in zip(triggers, reads):
+        assert trigger[1] == read[1]
+        assert read[0] - trigger[0] >= 0.045
+
+
+def test_failing_device_does_not_abort_group():
+    connection = I2cConnection(TransceiverStub(nack_addresses=(0x22,)))
+    group = SdpI2cDeviceGroup([SdpI2cDevice(connection, address) for address in ADDRESSES])
+    results = group.trigger_and_read_measurement_with_mass_flow_t_comp_and_averaging()
+    assert isinstance(results[1], I2cNackError)
+    assert all(not isinstance(r, Exception) for i, r in enumerate(results) if i != 1)
+    results = group.read_measurement()
+    assert isinstance(results[1], I2cNackError)
+    assert results[0][0].ticks == -90
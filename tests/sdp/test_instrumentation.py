@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import pytest
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.instrumentation import SdpHistogram, SdpObserver, SdpStatistics
+
+
+def test_statistics(simulated_sdp):
+    statistics = SdpStatistics()
+    simulated_sdp.observer = statistics
+    simulated_sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    for _ in range(10):
+        simulated_sdp.read_measurement()
+    simulated_sdp.stop_continuous_measurement()
+    with pytest.raises(I2cNackError):
+        simulated_sdp.read_measurement()
+
+    snapshot = statistics.snapshot()
+    assert snapshot["commands"] == {
+        "SdpI2cCmdStartContinuousMeasurementWithDiffPressureTComp": 1,
+        "SdpI2cCmdReadMeasurementFast": 11,
+        "SdpI2cCmdStopContinuousMeasurement": 1,
+    }
+    assert snapshot["samples"] == 10
+    assert snapshot["sample_rate"] > 0
+    assert snapshot["nacks"] == 1
+    assert snapshot["crc_errors"] == 0
+    assert snapshot["bus_time"]["count"] == 13
+    assert snapshot["wait_time"]["maximum"] > 0.005  # post processing of the start command
+    assert snapshot["read_delay"]["maximum"] == 0.0  # the mode is known, thus reads are not delayed
+
+    statistics.reset()
+    assert statistics.snapshot()["samples"] == 0
+
+
+def test_custom_observer(simulated_sdp):
+    class Observer(SdpObserver):
+        def __init__(self):
+            self.calls = []
+
+        def on_command(self, device, command, bus_time, read_delay, wait_time, error):
+            self.calls.append((device, type(command).__name__, error))
+
+    observer = Observer()
+    simulated_sdp.observer = observer
+    simulated_sdp.read_product_identifier()
+    assert observer.calls == [
+        (simulated_sdp, "SdpI2cCmdPrepareProductIdentifier", None),
+        (simulated_sdp, "SdpI2cCmdReadProductIdentifierFast", None),
+    ]
+
+
+def test_histogram():
+    histogram = SdpHistogram()
+    for value in (0.0, 0.00001, 0.00002, 0.045, 100.0):
+        histogram.add(value)
+    result = histogram.to_dict()
+    assert result["count"] == 5
+    assert result["minimum"] == 0.0
+    assert result["maximum"] == 100.0
+    assert result["bucket_counts"][0] == 2
+    assert result["bucket_counts"][1] == 1
+    assert result["bucket_counts"][-1] == 1
+    assert sum(result["bucket_counts"]) == 5
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+from sensirion_i2c_sdp.sdp import products
+from sensirion_i2c_sdp.sdp.data_types import SdpProductFamily
+from sensirion_i2c_sdp.sdp.products import SdpProduct, get_product, get_products, register_product
+
+
+def test_get_product_ignores_revision():
+    product = get_product(0x03020A01)
+    assert product.name == "SDP810-500Pa"
+    assert product.family is SdpProductFamily.SDP8XX
+    assert (product.range, product.scale_factor) == (500, 60)
+    assert product.slave_addresses == (0x25, 0x26)
+    assert get_product(0x03020AFF) is product
+
+
+def test_get_unknown_product():
+    assert get_product(0x12345678) is None
+
+
+def test_sdp3x_products():
+    assert {p.name: p.scale_factor for p in get_products() if p.family is SdpProductFamily.SDP3X} == \
+        {"SDP31": 60, "SDP32": 240, "SDP33": 20}
+
+
+def test_register_product(monkeypatch):
+    # don't leak the custom product into other tests
+    monkeypatch.setattr(products, "_products", dict(products._products))
+    product = SdpProduct(0x0302FF00, "Custom", SdpProductFamily.SDP8XX, 250, 120, (0x25,))
+    register_product(product)
+    assert get_product(0x0302FF07) is product
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from sensirion_i2c_sdp.sdp.recording import SdpRecordingReader, SdpRecordingWriter
+from sensirion_i2c_sdp.sdp.stream import SdpSample
+
+np = pytest.importorskip("numpy")
+
+
+def write_samples(path, count, chunk_size=100, scale_factor=60):
+    with SdpRecordingWriter(path, chunk_size=chunk_size) as writer:
+        for i in range(count):
+            writer.write(1000.0 + i * 0.0005, i - 500, 5000 + i % 7, scale_factor)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 1000)
+    assert os.path.getsize(path) == 10 * 24 + 1000 * 8
+    with SdpRecordingReader(path) as reader:
+        assert len(reader) == 1000
+        assert len(reader.chunks) == 10
+        data = reader.read()
+        assert np.allclose(data.timestamps, 1000.0 + np.arange(1000) * 0.0005, rtol=0, atol=1e-6)
+        assert np.array_equal(data.differential_pressure_ticks, np.arange(1000) - 500)
+        assert np.array_equal(data.temperature_ticks, 5000 + np.arange(1000) % 7)
+        assert data.scale_factor == 60
+
+
+def test_read_chunk_without_copy(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 250)
+    with SdpRecordingReader(path) as reader:
+        data = reader.read_chunk(2)
+        assert not data.differential_pressure_ticks.flags.owndata
+        assert not data.differential_pressure_ticks.flags.writeable
+        assert list(data.differential_pressure_ticks[:2]) == [-300, -299]
+    # still valid after closing the reader
+    assert list(data.temperature_ticks[:2]) == [5000 + 200 % 7, 5000 + 201 % 7]
+
+
+def test_read_time_range(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 1000)
+    with SdpRecordingReader(path) as reader:
+        data = reader.read(start=1000.0 + 139.5 * 0.0005, end=1000.0 + 259.5 * 0.0005)
+        assert list(data.differential_pressure_ticks) == list(range(140 - 500, 260 - 500))
+        assert len(reader.read(start=2000.0).timestamps) == 0
+
+
+def test_append_and_scale_factor_segments(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 10, scale_factor=60)
+    with SdpRecordingWriter(path) as writer:
+        writer.write_samples([SdpSample(2000.0, 1, 2, 240, True, True), SdpSample(2000.001, 3, 4, 240, True, True)])
+    with SdpRecordingReader(path) as reader:
+        assert [c.scale_factor for c in reader.chunks] == [60, 240]
+        data = reader.read()
+        assert list(data.scale_factor) == [60] * 10 + [240] * 2
+        assert data.timestamps[-1] == pytest.approx(2000.001)
+
+
+def test_recover_missing_index(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 300)
+    with open(path + ".idx", "r+b") as f:
+        f.truncate(32)  # only the first chunk is indexed
+    with open(path, "ab") as f:
+        f.write(b"SDPC\xff")  # incomplete chunk
+    with SdpRecordingReader(path) as reader:
+        assert len(reader) == 300
+        assert reader.chunks[-1].last_timestamp == pytest.approx(1000.0 + 299 * 0.0005)
+
+
+def test_recover_missing_index_before_appended_chunks(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    write_samples(path, 300)
+    with open(path + ".idx", "r+b") as f:
+        f.truncate(2 * 32)  # the last chunk was not indexed before a crash
+    with open(path, "ab") as f:
+        f.write(b"SDPC\xff\x00\x00\x00")  # incomplete chunk
+    with SdpRecordingWriter(path) as writer:
+        writer.write(2000.0, 1, 2, 60)
+    with SdpRecordingReader(path) as reader:
+        assert [c.sample_count for c in reader.chunks] == [100, 100, 100, 1]
+        data = reader.read()
+        assert list(data.differential_pressure_ticks) == list(range(-500, -200)) + [1]
+
+
+def test_long_pause_starts_new_chunk(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    with SdpRecordingWriter(path) as writer:
+        writer.write(0.0, 1, 2, 60)
+        writer.write(1e5, 3, 4, 60)
+    with SdpRecordingReader(path) as reader:
+        assert len(reader.chunks) == 2
+        assert list(reader.read().timestamps) == [0.0, 1e5]
+
+
+def test_read_time_range_non_monotonic(tmp_path):
+    path = str(tmp_path / "test.sdprec")
+    with SdpRecordingWriter(path) as writer:
+        writer.write(1000.0, 1, 2, 60)
+        writer.write(10.0, 3, 4, 60)  # clock reset, starts a new chunk
+        writer.write(20.0, 5, 6, 60)
+    with SdpRecordingReader(path) as reader:
+        assert [c.first_timestamp for c in reader.chunks] == [1000.0, 10.0]
+        assert list(reader.read(start=15.0).timestamps) == [1000.0, 20.0]
+        assert list(reader.read(start=5.0, end=15.0).differential_pressure_ticks) == [3]
+        assert list(reader.read().differential_pressure_ticks) == [1, 3, 5]
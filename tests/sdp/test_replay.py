@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.replay import SdpCapturingI2cTransceiver, SdpReplayError, SdpReplayI2cTransceiver, \
+    load_traffic
+from sensirion_i2c_sdp.sdp.simulation import SdpSimulatedI2cTransceiver, SdpSimulatedSensor
+
+
+def session(sdp):
+    results = [sdp.read_product_identifier()]
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    results += [tuple(value.ticks for value in sdp.read_measurement()) for _ in range(5)]
+    sdp.stop_continuous_measurement()
+    try:
+        sdp.read_measurement()
+    except I2cNackError as e:
+        results.append(type(e))
+    return results
+
+
+@pytest.fixture
+def captured():
+    sensors = {0x25: SdpSimulatedSensor(differential_pressure=3.0, noise=1.0, seed=1)}
+    f = io.StringIO()
+    sdp = SdpI2cDevice(I2cConnection(SdpCapturingI2cTransceiver(SdpSimulatedI2cTransceiver(sensors), f)))
+    start = time.monotonic()
+    results = session(sdp)
+    return results, time.monotonic() - start, load_traffic(io.StringIO(f.getvalue()))
+
+
+def test_capture(captured):
+    _, _, frames = captured
+    assert len(frames) == 10
+    assert frames[0].time == 0.0
+    assert (frames[0].slave_address, frames[0].tx_data, frames[0].rx_length) == (0x25, b"\x36\x7C", None)
+    assert frames[-1].status == SdpReplayI2cTransceiver.STATUS_NACK
+
+
+def test_replay(captured):
+    results, _, frames = captured
+    transceiver = SdpReplayI2cTransceiver(frames)
+    assert session(SdpI2cDevice(I2cConnection(transceiver))) == results
+    assert transceiver.position == len(frames)
+    with pytest.raises(SdpReplayError):
+        session(SdpI2cDevice(I2cConnection(transceiver)))
+
+
+def test_replay_realtime(captured):
+    results, duration, frames = captured
+    start = time.monotonic()
+    assert session(SdpI2cDevice(I2cConnection(SdpReplayI2cTransceiver(frames, realtime=True)))) == results
+    assert time.monotonic() - start == pytest.approx(duration, abs=0.01)
+
+
+def test_replay_loop(captured):
+    results, _, frames = captured
+    transceiver = SdpReplayI2cTransceiver(frames, loop=True)
+    for _ in range(2):
+        assert session(SdpI2cDevice(I2cConnection(transceiver))) == results
+
+
+def test_replay_mismatch(captured):
+    _, _, frames = captured
+    sdp = SdpI2cDevice(I2cConnection(SdpReplayI2cTransceiver(frames)))
+    with pytest.raises(SdpReplayError):
+        sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    sdp = SdpI2cDevice(I2cConnection(SdpReplayI2cTransceiver(frames, strict=False)))
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
@@ -24,6 +24,7 @@ def test_differential_pressure(value):
     assert result.ticks == value.get('ticks')
     assert type(result.pascal) is float
     assert result.pascal == pytest.approx(value.get('pascal'), 0.01)
+    assert not hasattr(result, '__dict__')
 
 
 @pytest.mark.parametrize("value", [
@@ -45,3 +46,4 @@ def test_temperature(value):
     assert result.degrees_celsius == value.get('degrees_celsius')
     assert type(result.degrees_fahrenheit) is float
     assert result.degrees_fahrenheit == value.get('degrees_fahrenheit')
+    assert not hasattr(result, '__dict__')
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.commands import SdpI2cCmdReadMeasurement, SdpI2cCmdTriggerMeasurementWithDiffPressureTComp
+from sensirion_i2c_sdp.sdp.data_types import SdpMeasurementMode
+from sensirion_i2c_sdp.sdp.device import SdpI2cDevice
+from sensirion_i2c_sdp.sdp.simulation import UPDATE_INTERVAL, WAKE_UP_TIME, SdpSimulatedI2cTransceiver, \
+    SdpSimulatedSensor
+
+
+def test_read_product_identifier(simulated_sdp):
+    assert simulated_sdp.read_product_identifier() == (0x03020A01, 0x0123456789ABCDEF)
+
+
+def test_read_measurement_continuous(simulated_sdp, sdp_simulator):
+    sdp_simulator.sensors[0x25].differential_pressure = -1.5
+    simulated_sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    for read in (simulated_sdp.read_measurement, simulated_sdp.read_measurement_fast):
+        dp, temperature = read()
+        assert dp.ticks == -90
+        assert dp.pascal == -1.5
+        assert temperature.degrees_celsius == 25.0
+    simulated_sdp.stop_continuous_measurement()
+    assert sdp_simulator.sensors[0x25].mode is SdpMeasurementMode.IDLE
+
+
+def test_read_measurement_single_shot(simulated_sdp):
+    simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+    dp, temperature = simulated_sdp.read_measurement()
+    assert dp.scale_factor == 60
+    # the result can only be read once
+    with pytest.raises(I2cNackError):
+        simulated_sdp.read_measurement()
+    dp, temperature = simulated_sdp.trigger_and_read_measurement_with_diff_pressure_t_comp_and_averaging()
+    assert dp.scale_factor == 60
+
+
+def test_busy_during_triggered_measurement(sdp_simulator):
+    connection = I2cConnection(sdp_simulator)
+    connection.execute(0x25, SdpI2cCmdTriggerMeasurementWithDiffPressureTComp(), wait_post_process=False)
+    with pytest.raises(I2cNackError):
+        connection.execute(0x25, SdpI2cCmdReadMeasurement())
+    time.sleep(0.045)
+    dp, _ = connection.execute(0x25, SdpI2cCmdReadMeasurement())
+    assert dp.ticks == 0
+
+
+def test_no_commands_during_continuous_measurement(simulated_sdp):
+    simulated_sdp.start_continuous_measurement_with_mass_flow_t_comp()
+    with pytest.raises(I2cNackError):
+        simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+    with pytest.raises(I2cNackError):
+        simulated_sdp.enter_sleep_mode()
+    simulated_sdp.stop_continuous_measurement()
+
+
+def test_sleep_mode_should_be_sleeping(simulated_sdp):
+    simulated_sdp.enter_sleep_mode()
+    with pytest.raises(I2cNackError):
+        simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+    # still waking up
+    with pytest.raises(I2cNackError):
+        simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+    time.sleep(WAKE_UP_TIME)
+    simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+
+
+def test_sleep_mode_should_wake_up(simulated_sdp):
+    simulated_sdp.enter_sleep_mode()
+    with pytest.raises(I2cNackError):
+        simulated_sdp.exit_sleep_mode()
+    simulated_sdp.trigger_measurement_with_mass_flow_t_comp_and_averaging()
+
+
+def test_continuous_results_updated_every_interval():
+    sensor = SdpSimulatedSensor(noise=100.0, seed=1)
+    assert sensor.write(b"\x36\x1E", 0.0)
+    first = sensor.read(9, 0.008)
+    assert sensor.read(9, 0.008 + UPDATE_INTERVAL * 0.9) == first
+    second = sensor.read(9, 0.008 + UPDATE_INTERVAL)
+    assert second != first
+    assert sensor.read(3, 0.008 + UPDATE_INTERVAL * 1.5) == second[:3]
+
+
+def test_stream_flags_duplicates_of_simulated_sensor():
+    # noise makes every new result distinguishable from the previous one
+    sensors = {0x25: SdpSimulatedSensor(noise=100.0, seed=7)}
+    sdp = SdpI2cDevice(I2cConnection(SdpSimulatedI2cTransceiver(sensors)))
+    with sdp.stream(rate=20000.0, buffer_size=100000) as stream:
+        time.sleep(0.05)
+    samples = stream.read()
+    assert len(samples) > 2 * 0.04 / UPDATE_INTERVAL  # read faster than 2kHz
+    duplicates = 0
+    last_fresh = None
+    for sample in samples:
+        if sample.fresh:
+            # a fresh sample contains a newer result than the last fresh one
+            assert last_fresh is None or sample.differential_pressure_ticks != last_fresh.differential_pressure_ticks
+            last_fresh = sample
+        elif sample.differential_pressure_ticks == last_fresh.differential_pressure_ticks:
+            duplicates += 1
+    assert duplicates > 0
+
+
+def test_missing_device_is_not_acknowledged(sdp_simulator):
+    with pytest.raises(I2cNackError):
+        SdpI2cDevice(I2cConnection(sdp_simulator), slave_address=0x21).read_product_identifier()
+
+
+def test_noise_and_latency():
+    sensors = {0x21: SdpSimulatedSensor(scale_factor=240, differential_pressure=10.0, noise=1.0, seed=42)}
+    sdp = SdpI2cDevice(I2cConnection(SdpSimulatedI2cTransceiver(sensors, latency=0.002)), slave_address=0x21)
+    sdp.start_continuous_measurement_with_diff_pressure_t_comp()
+    start = time.monotonic()
+    values = [sdp.read_measurement()[0].pascal for _ in range(10)]
+    assert time.monotonic() - start >= 10 * 0.002
+    assert len(set(values)) > 1
+    assert 5.0 < sum(values) / len(values) < 15.0
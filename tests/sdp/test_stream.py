@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pytest
+from sensirion_i2c_driver import I2cConnection
+from sensirion_i2c_driver.errors import I2cNackError
+
+from sensirion_i2c_sdp.sdp.device import CONTINUOUS_SETTLING_TIME, SdpI2cDevice
+from sensirion_i2c_sdp.sdp.response_types import SdpDifferentialPressure, SdpTemperature
+from sensirion_i2c_sdp.sdp.stream import SdpStream
+
+
+class ConnectionStub(object):
+    is_multi_channel = False
+
+
+class DeviceStub(object):
+    """
+    Minimal stand-in for SdpI2cDevice returning increasing ticks.
+    """
+
+    is_last_result_new = True
+    is_measurement_settled = True
+
+    connection = ConnectionStub()
+
+    def __init__(self, fail_every=0, fail_with=None):
+        self.running = False
+        self.ticks = 0
+        self.fail_every = fail_every
+        self.fail_with = fail_with or I2cNackError(None, None)
+
+    def start_continuous_measurement_with_diff_pressure_t_comp(self):
+        self.running = True
+
+    def stop_continuous_measurement(self):
+        self.running = False
+
+    def read_measurement(self):
+        self.ticks += 1
+        if self.fail_every and self.ticks % self.fail_every == 0:
+            raise self.fail_with
+        return SdpDifferentialPressure(self.ticks, 60), SdpTemperature(5000)
+
+    read_measurement_fast = read_measurement
+
+
+def test_stream_acquires_samples():
+    device = DeviceStub()
+    with SdpStream(device, rate=1000.0) as stream:
+        assert device.running is True
+        time.sleep(0.05)
+    assert device.running is False
+    samples = stream.read()
+    assert len(samples) > 5
+    assert [s.differential_pressure_ticks for s in samples] == list(range(1, len(samples) + 1))
+    assert all(s.scale_factor == 60 and s.temperature_ticks == 5000 for s in samples)
+    assert all(a.timestamp < b.timestamp for a, b in zip(samples, samples[1:]))
+    assert stream.available == 0
+
+
+def test_stream_read_in_batches():
+    device = DeviceStub()
+    with SdpStream(device, rate=1000.0) as stream:
+        time.sleep(0.02)
+    total = stream.available
+    first = stream.read(max_count=3)
+    rest = stream.read()
+    assert len(first) == 3
+    assert len(first) + len(rest) == total
+    assert rest[0].differential_pressure_ticks == 4
+
+
+def test_stream_overflow_keeps_newest():
+    device = DeviceStub()
+    with SdpStream(device, rate=1000.0, buffer_size=4) as stream:
+        time.sleep(0.03)
+    samples = stream.read()
+    assert len(samples) == 4
+    assert stream.overflow_count == device.ticks - 4
+    assert samples[-1].differential_pressure_ticks == device.ticks
+
+
+def test_stream_counts_errors():
+    device = DeviceStub(fail_every=2)
+    with SdpStream(device, rate=1000.0) as stream:
+        time.sleep(0.02)
+    assert stream.error_count > 0
+    assert isinstance(stream.last_error, I2cNackError)
+    assert all(s.differential_pressure_ticks % 2 == 1 for s in stream.read())
+
+
+def test_stream_ends_on_other_errors():
+    device = DeviceStub(fail_every=3, fail_with=OSError("port closed"))
+    stream = SdpStream(device, rate=1000.0)
+    stream.start()
+    stream._thread.join(1.0)
+    assert not stream.is_running
+    assert stream.error_count == 1
+    assert isinstance(stream.last_error, OSError)
+    assert len(stream.read()) == 2
+    stream.stop()
+    assert not device.running
+
+
+def test_stream_rejects_multi_channel_connections(sdp_simulator):
+    connection = I2cConnection(sdp_simulator)
+    connection.always_multi_channel_response = True
+    with pytest.raises(ValueError):
+        SdpStream(SdpI2cDevice(connection))
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(rate=0),
+    dict(buffer_size=0),
+])
+def test_stream_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        SdpStream(DeviceStub(), **kwargs)
+
+
+def test_stream_tags_duplicates(simulated_sdp):
+    with simulated_sdp.stream(rate=100000.0, buffer_size=100000) as stream:
+        time.sleep(0.03)
+    samples = stream.read()
+    fresh = [s for s in samples if s.fresh]
+    assert samples[0].fresh is True
+    assert stream.duplicate_count == len(samples) - len(fresh) > 0
+    # the sensor updates its result every 0.5ms
+    assert len(fresh) <= (samples[-1].timestamp - samples[0].timestamp) / 0.0005 + 1
+    assert 0 < stream.unique_sample_rate
+
+
+def test_stream_restart_resets_counters(simulated_sdp):
+    stream = simulated_sdp.stream(rate=100000.0)
+    with stream:
+        time.sleep(0.01)
+    assert stream.duplicate_count > 0
+    simulated_sdp.pace_reads = True
+    with stream:
+        time.sleep(0.01)
+    assert stream.duplicate_count == 0
+
+
+def test_stream_drops_duplicates(simulated_sdp, sdp_simulator):
+    with simulated_sdp.stream(rate=100000.0, drop_duplicates=True) as stream:
+        time.sleep(0.03)
+    samples = stream.read()
+    assert stream.duplicate_count > 0
+    assert len(samples) + stream.duplicate_count == sdp_simulator.transfer_count - 2  # without start and stop
+    assert all(s.fresh for s in samples)
+
+
+def test_stream_paced_reads_are_new(simulated_sdp):
+    simulated_sdp.pace_reads = True
+    with simulated_sdp.stream(rate=100000.0) as stream:
+        time.sleep(0.03)
+    samples = stream.read()
+    assert len(samples) > 5
+    assert stream.duplicate_count == 0
+    assert all(s.fresh for s in samples)
+
+
+def test_stream_tags_unsettled_samples(simulated_sdp):
+    with simulated_sdp.stream(rate=1000.0) as stream:
+        started_at = simulated_sdp.measurement_started_at
+        time.sleep(0.04)
+    samples = stream.read()
+    assert samples[0].settled is False
+    assert samples[-1].settled is True
+    assert all(s.settled == (s.timestamp - started_at >= CONTINUOUS_SETTLING_TIME)
+               for s in samples if abs(s.timestamp - started_at - CONTINUOUS_SETTLING_TIME) > 0.001)
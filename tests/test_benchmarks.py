@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# (c) Copyright 2021 Sensirion AG, Switzerland
+
+from __future__ import absolute_import, division, print_function
+
+import json
+
+from benchmarks.hot_path import main
+
+
+def test_benchmarks(tmpdir):
+    output = str(tmpdir.join("results.json"))
+    assert main(["--iterations", "100", "--output", output]) == 0
+    with open(output) as f:
+        results = json.load(f)["results"]
+    names = set(r["name"] for r in results)
+    assert names == {"interpret_response", "response_objects", "command_construction", "read_measurement"}
+    modes = [(r["mode"], r["sensors"]) for r in results if r["name"] == "read_measurement"]
+    assert sorted(modes) == sorted((m, n) for m in ("continuous", "triggered") for n in (1, 10, 100))
+    assert all(r["per_call_us"] > 0 for r in results)
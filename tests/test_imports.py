@@ -15,7 +15,7 @@ EXCLUDES = []  # Regex: remember to use \. !
 root_path = path.join(path.dirname(__file__), "..")
 
 
-@mark.parametrize("package", find_packages(where=root_path, exclude=['tests', 'tests.*']))
+@mark.parametrize("package", find_packages(where=root_path, exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']))
 def test_import(package):
     """Tests if all (sub-)packages are importables."""
     module = importlib.import_module(package)